@@ -126,9 +126,14 @@ class Item(Area):
         return self.transport.GET(url='/item/app/%d/external_id/%s' % (app_id, external_id))
 
     def create(self, app_id, attributes, silent=False, hook=True):
-        if not isinstance(attributes, dict):
-            raise TypeError('Must be of type dict')
-        attributes = json.dumps(attributes)
+        """
+        Creates an item. 'attributes' may be a dict, or an already encoded
+        JSON document (bytes) which is sent as-is.
+        """
+        if isinstance(attributes, dict):
+            attributes = json.dumps(attributes)
+        elif not isinstance(attributes, bytes):
+            raise TypeError('Must be of type dict or bytes')
         return self.transport.POST(body=attributes,
                                    type='application/json',
                                    url='/item/app/%d/%s' % (app_id,
@@ -141,10 +146,14 @@ class Item(Area):
         no notifications to subscribed users and not post updates to the stream.
         
         Important: webhooks will still be called.
+
+        'attributes' may be a dict, or an already encoded JSON document
+        (bytes) which is sent as-is.
         """
-        if not isinstance(attributes, dict):
-            raise TypeError('Must be of type dict')
-        attributes = json.dumps(attributes)
+        if isinstance(attributes, dict):
+            attributes = json.dumps(attributes)
+        elif not isinstance(attributes, bytes):
+            raise TypeError('Must be of type dict or bytes')
         return self.transport.PUT(body=attributes,
                                   type='application/json',
                                   url='/item/%d%s' % (item_id, self.get_options(silent=silent,
@@ -734,6 +743,13 @@ class Files(Area):
         raw_handler = lambda resp, data: data
         return self.transport.GET(url='/file/%d/raw' % file_id, handler=raw_handler)
 
+    def download_raw(self, file_id, fileobj):
+        """
+        Stream the raw file into a writable binary file object without
+        holding the whole file in memory. Returns the number of bytes written.
+        """
+        return self.transport.stream('/file/%d/raw' % file_id, fileobj)
+
     def attach(self, file_id, ref_type, ref_id):
         attributes = {
             'ref_type': ref_type,
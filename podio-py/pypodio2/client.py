@@ -21,6 +21,13 @@ class Client(object):
     def __init__(self, transport):
         self.transport = transport
 
+    def clone(self):
+        """
+        Return a client with the same credentials but its own connection,
+        for use on another thread. See HttpTransport.clone().
+        """
+        return Client(self.transport.clone())
+
     def __getattr__(self, name):
         new_trans = self.transport
         area = getattr(areas, name)
@@ -340,10 +340,11 @@ def get_headers(params, boundary):
 
 
 class MultipartYielder:
-    def __init__(self, params, boundary, cb):
+    def __init__(self, params, boundary, cb, blocksize=4096):
         self.params = params
         self.boundary = boundary
         self.cb = cb
+        self.blocksize = blocksize
 
         self.i = 0
         self.p = None
@@ -381,7 +382,7 @@ class MultipartYielder:
             return block
 
         self.p = self.params[self.i]
-        self.param_iter = self.p.iter_encode(self.boundary)
+        self.param_iter = self.p.iter_encode(self.boundary, self.blocksize)
         self.i += 1
         return next(self)
 
@@ -395,7 +396,7 @@ class MultipartYielder:
             param.reset()
 
 
-def multipart_encode(params, boundary=None, cb=None):
+def multipart_encode(params, boundary=None, cb=None, blocksize=4096):
     """Encode ``params`` as multipart/form-data.
 
     ``params`` should be a sequence of (name, value) pairs or MultipartParam
@@ -414,6 +415,8 @@ def multipart_encode(params, boundary=None, cb=None):
     indicating the current parameter being encoded, the current amount encoded,
     and the total amount to encode.
 
+    File-like values are read ``blocksize`` bytes at a time.
+
     Returns a tuple of `datagen`, `headers`, where `datagen` is a
     generator that will yield blocks of data that make up the encoded
     parameters, and `headers` is a dictionary with the assoicated
@@ -443,4 +446,4 @@ def multipart_encode(params, boundary=None, cb=None):
     headers = get_headers(params, boundary)
     params = MultipartParam.from_params(params)
 
-    return MultipartYielder(params, boundary, cb), headers
+    return MultipartYielder(params, boundary, cb, blocksize), headers
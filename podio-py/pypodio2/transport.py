@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
-from httplib2 import Http
+from httplib2 import Http, Response
 import time
 import random
+import threading
 
 try:
     from urllib.parse import urlencode
+    from urllib.request import Request, urlopen
+    from urllib.error import HTTPError
 except ImportError:
     from urllib import urlencode
+    from urllib2 import Request, urlopen, HTTPError
 
 from .encode import multipart_encode
 
@@ -282,6 +286,10 @@ class KeepAliveHeaders(object):
         return headers
 
 
+# Bytes read per chunk by HttpTransport.stream()
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+
 class TransportException(Exception):
 
     def __init__(self, status, content):
@@ -304,11 +312,42 @@ class HttpTransport(object):
         self._method = "GET"
         self._posts = []
         self._http = Http(disable_ssl_certificate_validation=True)
+        self._refresh_lock = threading.Lock()  # shared with clone()s on other threads
         self._params = {}
         self._url_template = '%(domain)s/%(generated_url)s'
         self._stack_collapser = "/".join
         self._params_template = '?%s'
 
+    def clone(self):
+        """
+        Return a transport with the same credentials and retry settings but
+        its own connection and request state.
+
+        A transport is not thread-safe (requests are built up in attributes
+        and share one httplib2 connection), so each thread needs its own
+        clone. Clones share the auth object and refresh the token only once
+        between them.
+        """
+        twin = HttpTransport(self._api_url, self._headers_factory,
+                             auth_object=self._auth_object, retry_config=self._retry_config)
+        twin._refresh_lock = self._refresh_lock
+        return twin
+
+    def _refresh_token(self, used_headers):
+        """
+        Refresh the OAuth token after a 401 response.
+
+        :param used_headers: Headers the rejected request was sent with
+        :return: True if the request should be retried with fresh headers
+        """
+        if not (self._auth_object and isinstance(self._auth_object, OAuthTokenAuthorization)):
+            return False
+        with self._refresh_lock:
+            # Another thread may already have refreshed the token
+            if self._headers_factory().get('authorization') != used_headers.get('authorization'):
+                return True
+            return self._auth_object.refresh_access_token()
+
     def __call__(self, *args, **kwargs):
         self._attribute_stack += [str(a) for a in args]
         self._params = kwargs
@@ -323,7 +362,9 @@ class HttpTransport(object):
             body = json.dumps(kwargs)
         elif 'type' in kwargs:
             if kwargs['type'] == 'multipart/form-data':
-                body, new_headers = multipart_encode(kwargs['body'])
+                # The whole body is joined into one bytes object anyway, so
+                # read file parts in large blocks rather than 4 KiB at a time
+                body, new_headers = multipart_encode(kwargs['body'], blocksize=1024 * 1024)
                 body = b"".join(body)
             else:
                 body = kwargs['body']
@@ -348,18 +389,16 @@ class HttpTransport(object):
                 response, data = self._http.request(url, self._method, body=body, headers=headers)
 
                 # Handle 401 Unauthorized with token refresh
-                if response.status == 401 and self._auth_object and isinstance(self._auth_object, OAuthTokenAuthorization):
-                    if hasattr(self._auth_object, 'refresh_access_token'):
-                        if self._auth_object.refresh_access_token():
-                            # Retry immediately with new token
-                            headers = self._headers_factory()
-                            if (self._method == "POST" or self._method == "PUT") and 'type' not in kwargs:
-                                headers.update({'content-type': 'application/json'})
-                            elif 'type' in kwargs and kwargs['type'] == 'multipart/form-data':
-                                headers.update(new_headers)
-                            elif 'type' in kwargs:
-                                headers.update({'content-type': kwargs['type']})
-                            response, data = self._http.request(url, self._method, body=body, headers=headers)
+                if response.status == 401 and self._refresh_token(headers):
+                    # Retry immediately with new token
+                    headers = self._headers_factory()
+                    if (self._method == "POST" or self._method == "PUT") and 'type' not in kwargs:
+                        headers.update({'content-type': 'application/json'})
+                    elif 'type' in kwargs and kwargs['type'] == 'multipart/form-data':
+                        headers.update(new_headers)
+                    elif 'type' in kwargs:
+                        headers.update({'content-type': kwargs['type']})
+                    response, data = self._http.request(url, self._method, body=body, headers=headers)
 
                 # Handle rate limiting (429)
                 if response.status == 429 and self._retry_config.retry_on_rate_limit:
@@ -418,6 +457,61 @@ class HttpTransport(object):
         handler = kwargs.get('handler', _handle_response)
         return handler(response, data)
 
+    def stream(self, url, fileobj, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        GET a URL and copy the response body into a file object.
+
+        The regular request path goes through httplib2, which buffers the
+        whole body in memory. This reads and writes one chunk at a time, so
+        large file downloads use constant memory. Token refresh and retries
+        apply until the first byte has been written.
+
+        :param url: API path, e.g. '/file/123/raw'
+        :param fileobj: Writable binary file object
+        :param chunk_size: Number of bytes to read per chunk
+        :return: Number of bytes written
+        """
+        url = self._url_template % {'domain': self._api_url, 'generated_url': url[1:]}
+        refreshed = False
+        attempt = 0
+        while True:
+            headers = self._headers_factory()
+            try:
+                response = urlopen(Request(url, headers=headers))
+            except HTTPError as e:
+                if e.code == 401 and not refreshed and self._refresh_token(headers):
+                    refreshed = True
+                    continue
+                retryable = e.code >= 500 or (e.code == 429 and self._retry_config.retry_on_rate_limit)
+                if retryable and attempt < self._retry_config.max_retries:
+                    time.sleep(self._retry_config.calculate_delay(attempt))
+                    attempt += 1
+                    continue
+                info = dict(e.headers.items())
+                info['status'] = str(e.code)
+                raise TransportException(Response(info), e.read().decode("utf-8", "replace"))
+            except (IOError, OSError):
+                if attempt < self._retry_config.max_retries:
+                    time.sleep(self._retry_config.calculate_delay(attempt))
+                    attempt += 1
+                    continue
+                raise
+            break
+
+        # Read into one reusable buffer instead of allocating a new bytes
+        # object per chunk
+        buf = bytearray(chunk_size)
+        view = memoryview(buf)
+        written = 0
+        with response:
+            while True:
+                n = response.readinto(buf)
+                if not n:
+                    break
+                fileobj.write(view[:n])
+                written += n
+        return written
+
     def _generate_params(self, params):
         body = self._params_template % urlencode(params)
         if body is None:
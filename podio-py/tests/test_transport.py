@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+"""
+Unit tests for pypodio2.transport.HttpTransport.stream(). Works by
+mocking urlopen, and making assertions about how stream() retries and
+what it writes.
+"""
+
+from io import BytesIO
+
+from mock import Mock, patch
+
+from pypodio2.transport import (HttpTransport, OAuthToken, OAuthTokenAuthorization,
+                                RetryConfig, TransportException)
+
+try:
+    from urllib.error import HTTPError
+except ImportError:
+    from urllib2 import HTTPError
+
+URL_BASE = 'https://api.example.com'
+
+
+def http_error(code):
+    return HTTPError(URL_BASE, code, 'error', {}, BytesIO(b'{"error": "x"}'))
+
+
+def get_oauth_transport(access_token='old'):
+    """
+    Gets an HttpTransport authorized with an OAuthTokenAuthorization whose
+    refresh swaps in a 'new' token. Returned as (transport, auth)
+    """
+    auth = OAuthTokenAuthorization(access_token, refresh_token='refresh')
+
+    def refresh():
+        auth.token = OAuthToken({'access_token': 'new', 'refresh_token': 'refresh', 'expires_in': 1})
+        return True
+    auth.refresh_access_token = Mock(side_effect=refresh)
+
+    transport = HttpTransport(URL_BASE, headers_factory=lambda: auth(), auth_object=auth,
+                              retry_config=RetryConfig(max_retries=2, jitter=False))
+    return transport, auth
+
+
+def test_stream_copies_body_in_chunks():
+    transport = HttpTransport(URL_BASE, headers_factory=dict)
+    out = BytesIO()
+
+    with patch('pypodio2.transport.urlopen', return_value=BytesIO(b'abcdefghij')) as urlopen:
+        written = transport.stream('/file/1/raw', out, chunk_size=4)
+
+    assert written == 10
+    assert out.getvalue() == b'abcdefghij'
+    assert urlopen.call_args[0][0].get_full_url() == URL_BASE + '/file/1/raw'
+
+
+def test_stream_refreshes_token_once_on_401():
+    transport, auth = get_oauth_transport()
+    out = BytesIO()
+    urlopen = Mock(side_effect=[http_error(401), BytesIO(b'data')])
+
+    with patch('pypodio2.transport.urlopen', urlopen):
+        transport.stream('/file/1/raw', out)
+
+    assert auth.refresh_access_token.call_count == 1
+    assert out.getvalue() == b'data'
+    # The retry is sent with the refreshed token
+    assert urlopen.call_args[0][0].get_header('Authorization') == 'OAuth2 new'
+
+
+def test_stream_does_not_refresh_twice():
+    transport, auth = get_oauth_transport()
+
+    with patch('pypodio2.transport.urlopen', Mock(side_effect=[http_error(401), http_error(401)])):
+        try:
+            transport.stream('/file/1/raw', BytesIO())
+        except TransportException as e:
+            assert e.status['status'] == '401'
+        else:
+            raise AssertionError('TransportException not raised')
+
+    assert auth.refresh_access_token.call_count == 1
+
+
+def test_stream_retries_server_errors_before_first_byte():
+    transport = HttpTransport(URL_BASE, headers_factory=dict,
+                              retry_config=RetryConfig(max_retries=2, jitter=False))
+    out = BytesIO()
+    urlopen = Mock(side_effect=[http_error(503), IOError('reset'), BytesIO(b'data')])
+
+    with patch('pypodio2.transport.urlopen', urlopen), patch('pypodio2.transport.time.sleep') as sleep:
+        transport.stream('/file/1/raw', out)
+
+    assert urlopen.call_count == 3
+    assert sleep.call_count == 2
+    assert out.getvalue() == b'data'
+
+
+def test_stream_gives_up_after_max_retries():
+    transport = HttpTransport(URL_BASE, headers_factory=dict,
+                              retry_config=RetryConfig(max_retries=1, jitter=False))
+    urlopen = Mock(side_effect=[http_error(500), http_error(500)])
+
+    with patch('pypodio2.transport.urlopen', urlopen), patch('pypodio2.transport.time.sleep'):
+        try:
+            transport.stream('/file/1/raw', BytesIO())
+        except TransportException as e:
+            assert e.status['status'] == '500'
+        else:
+            raise AssertionError('TransportException not raised')
+
+    assert urlopen.call_count == 2
+
+
+def test_stream_does_not_retry_after_first_byte():
+    transport = HttpTransport(URL_BASE, headers_factory=dict)
+    response = BytesIO(b'data')
+    response.readinto = Mock(side_effect=[2, IOError('reset')])
+    urlopen = Mock(return_value=response)
+
+    with patch('pypodio2.transport.urlopen', urlopen):
+        try:
+            transport.stream('/file/1/raw', BytesIO())
+        except IOError:
+            pass
+        else:
+            raise AssertionError('IOError not raised')
+
+    assert urlopen.call_count == 1
+
+
+def test_clone_shares_credentials_but_not_connection():
+    transport, auth = get_oauth_transport()
+
+    twin = transport.clone()
+
+    assert twin._http is not transport._http
+    assert twin._auth_object is auth
+    assert twin._retry_config is transport._retry_config
+    assert twin._refresh_lock is transport._refresh_lock
+    assert twin._headers_factory() == transport._headers_factory()
+
+
+def test_refresh_token_refreshes_stale_headers():
+    transport, auth = get_oauth_transport()
+
+    assert transport._refresh_token({'authorization': 'OAuth2 old'})
+    assert auth.refresh_access_token.call_count == 1
+
+
+def test_refresh_token_skips_when_another_thread_refreshed():
+    transport, auth = get_oauth_transport()
+    twin = transport.clone()
+    twin._refresh_token({'authorization': 'OAuth2 old'})
+
+    # The request was sent with the old token, which has since been replaced
+    assert transport._refresh_token({'authorization': 'OAuth2 old'})
+    assert auth.refresh_access_token.call_count == 1
+
+
+def test_refresh_token_without_oauth_token_auth():
+    transport = HttpTransport(URL_BASE, headers_factory=dict)
+
+    assert not transport._refresh_token({})
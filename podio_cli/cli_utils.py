@@ -0,0 +1,52 @@
+"""Input parsing helpers shared by Podio CLI commands."""
+import re
+import sys
+from typing import List, Optional
+
+import typer
+
+from .output import print_error
+
+
+# Comma-separated list of integer IDs, optionally padded with whitespace
+_ID_CSV_RE = re.compile(r"\s*\d+(?:\s*,\s*\d+)*\s*")
+
+
+def parse_id_csv(value: str) -> Optional[List[int]]:
+    """
+    Parse a comma-separated list of IDs.
+
+    The input is validated up front so the conversion itself cannot fail;
+    int() already ignores the whitespace around each entry.
+
+    Args:
+        value: Comma-separated IDs (e.g., "123456, 789012")
+
+    Returns:
+        List of integer IDs, or None if the input is not a valid ID list
+    """
+    if not _ID_CSV_RE.fullmatch(value):
+        return None
+    return list(map(int, value.split(",")))
+
+
+def read_stdin_text() -> str:
+    """
+    Read all of stdin as text, for commands that take a message body on stdin.
+
+    The raw bytes are read in one call and decoded once rather than going
+    through the line-buffered text wrapper. Invalid UTF-8 is replaced instead
+    of failing the command.
+
+    Returns:
+        The decoded input with surrounding whitespace stripped (may be empty)
+
+    Raises:
+        typer.Exit: If stdin cannot be read
+    """
+    try:
+        raw = sys.stdin.buffer.read()
+    except OSError as e:
+        print_error(f"Error reading from stdin: {e}")
+        raise typer.Exit(1)
+    return raw.decode("utf-8", "replace").strip()
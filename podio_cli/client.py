@@ -1,12 +1,14 @@
 """Podio client factory and wrapper."""
 import sys
-from typing import Optional
-from pypodio2 import api
+from typing import TYPE_CHECKING, Optional
 from .config import get_config
 
+if TYPE_CHECKING:
+    from pypodio2 import api
+
 
 # Global client instance
-_client: Optional[api.OAuthClient] = None
+_client: Optional["api.OAuthClient"] = None
 
 
 class ClientError(Exception):
@@ -14,10 +16,15 @@ class ClientError(Exception):
     pass
 
 
-def get_client() -> api.OAuthClient:
+def get_client() -> "api.OAuthClient":
     """
     Get or create the global Podio API client.
 
+    The client is built once per process and reused by every later call, so
+    commands invoked repeatedly in-process (tests, scripts driving the Typer
+    app) share one authenticated session. Call reset_client() after changing
+    credentials to force a new one.
+
     Returns:
         OAuthClient: Authenticated Podio API client
 
@@ -29,6 +36,10 @@ def get_client() -> api.OAuthClient:
     if _client is not None:
         return _client
 
+    # pypodio2 (and httplib2 behind it) is imported on first use so commands
+    # that never reach the API, --help and --version don't pay for it
+    from pypodio2 import api
+
     config = get_config()
     try:
         retry_config = config.get_retry_config()
@@ -5,8 +5,10 @@ import sys
 from pathlib import Path
 from typing import Optional, Any, List
 
+from .. import jsonio
 from ..client import get_client
 from ..config import get_config
+from ..filters import apply_field_filters, apply_properties_filter
 from ..output import print_json, print_output, print_error, handle_api_error, format_response
 
 app = typer.Typer(help="Manage Podio applications")
@@ -42,66 +44,6 @@ def _flatten_apps(data: Any) -> Any:
     return data
 
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
-    """Filter response data to include only specified properties."""
-    if not properties:
-        return data
-
-    prop_list = [p.strip() for p in properties.split(",")]
-
-    if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        return [{k: v for k, v in item.items() if k in prop_list} for item in data]
-
-    return data
-
-
-def _apply_client_filter(data: list, filters: list) -> list:
-    """Apply client-side filtering using field:op:value syntax."""
-    if not filters or not isinstance(data, list):
-        return data
-
-    result = data
-    for f in filters:
-        parts = f.split(":", 2)
-        if len(parts) < 2:
-            continue
-
-        field = parts[0]
-        if len(parts) == 2:
-            # field:value format (exact match)
-            op, value = "eq", parts[1]
-        else:
-            # field:op:value format
-            op, value = parts[1], parts[2]
-
-        filtered = []
-        for item in result:
-            item_value = item.get(field)
-            if item_value is None:
-                continue
-
-            # Convert to string for comparison
-            item_str = str(item_value).lower()
-            value_str = value.lower()
-
-            if op == "eq" and item_str == value_str:
-                filtered.append(item)
-            elif op == "ne" and item_str != value_str:
-                filtered.append(item)
-            elif op == "contains" and value_str in item_str:
-                filtered.append(item)
-            elif op == "gt" and item_str > value_str:
-                filtered.append(item)
-            elif op == "lt" and item_str < value_str:
-                filtered.append(item)
-
-        result = filtered
-
-    return result
-
-
 @app.command("get")
 def get_app(
     app_id: int = typer.Argument(..., help="Application ID to retrieve"),
@@ -183,7 +125,7 @@ def list_apps(
 
         # Apply client-side filter if specified
         if filter:
-            formatted = _apply_client_filter(formatted, filter)
+            formatted = apply_field_filters(formatted, filter)
 
         # Apply limit (client-side)
         if isinstance(formatted, list) and len(formatted) > limit:
@@ -191,7 +133,7 @@ def list_apps(
 
         # Apply properties filter
         if properties:
-            formatted = _apply_properties_filter(formatted, properties)
+            formatted = apply_properties_filter(formatted, properties)
 
         print_output(formatted, table=table)
     except Exception as e:
@@ -287,15 +229,12 @@ def create_app(
         podio app create --json-file app.json --table
     """
     try:
-        import json
-
         # Read JSON from file or stdin
         if json_file:
-            with open(json_file, 'r') as f:
-                app_data = json.load(f)
+            app_data = jsonio.load_file(json_file)
         else:
             # Read from stdin
-            app_data = json.load(sys.stdin)
+            app_data = jsonio.loads(sys.stdin.buffer.read())
 
         # Override space_id if provided as option
         if space_id is not None:
@@ -456,11 +395,8 @@ def add_field(
         podio app field add 12345 --type text --label "Title" --table
     """
     try:
-        import json as json_module
-
         if json_file:
-            with open(json_file, 'r') as f:
-                field_data = json_module.load(f)
+            field_data = jsonio.load_file(json_file)
             # Extract label from JSON for success message
             field_label = field_data.get('config', {}).get('label', 'field')
         else:
@@ -542,10 +478,7 @@ def update_field(
         podio app field update 12345 67890 --json-file field.json --table
     """
     try:
-        import json as json_module
-
-        with open(json_file, 'r') as f:
-            field_data = json_module.load(f)
+        field_data = jsonio.load_file(json_file)
 
         client = get_client()
         result = client.Application.update_field(app_id=app_id, field_id=field_id, attributes=field_data)
@@ -6,14 +6,52 @@ Implements the CLI-tools auth standards:
 - auth logout: Clear stored credentials/tokens
 """
 import typer
-from typing import Optional
-from pypodio2.transport import OAuthAuthorizationCodeAuthorization, OAuthTokenAuthorization
-from ..config import get_config
+from dataclasses import dataclass
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+from ..config import AuthMethod, get_config
 from ..output import print_json, print_table, print_error, print_success
 
 app = typer.Typer(help="Authentication management")
 
 
+@dataclass
+class ParsedCallback:
+    """OAuth callback URL split into its flow kind and parameters."""
+
+    kind: str  # "token" (fragment), "code" (query string) or "error"
+    params: Dict[str, str]
+
+
+def _parse_oauth_callback(url: str) -> ParsedCallback:
+    """
+    Parse an OAuth callback URL from either the client-side or server-side flow.
+
+    Args:
+        url: Full callback URL Podio redirected to
+
+    Returns:
+        ParsedCallback with the decoded parameters
+
+    Raises:
+        ValueError: If the URL has neither a fragment nor a query string
+    """
+    parts = urlsplit(url)
+
+    # Client-side flow puts the tokens in the fragment
+    if parts.fragment:
+        return ParsedCallback("token", dict(parse_qsl(parts.fragment)))
+
+    # Server-side flow puts the authorization code (or an error) in the query string
+    if parts.query:
+        params = dict(parse_qsl(parts.query))
+        if "code" not in params and "error" in params:
+            return ParsedCallback("error", params)
+        return ParsedCallback("code", params)
+
+    raise ValueError("Invalid callback URL format. Expected URL with ? (query) or # (fragment)")
+
+
 @app.command("status")
 def auth_status(
     table: bool = typer.Option(False, "--table", "-t", help="Display as formatted table"),
@@ -29,40 +67,33 @@ def auth_status(
     """
     config = get_config()
 
-    # Determine auth method and status
-    auth_method = None
-    is_authenticated = False
+    # Auth method is resolved once when the config is loaded
+    method = config.auth_method
+    auth_method = method.value if method else None
+    is_authenticated = method is not None
     details = {}
 
-    if config.has_token_auth():
-        auth_method = "token"
-        is_authenticated = True
+    if method is AuthMethod.TOKEN:
         details = {
             "method": "OAuth Token",
             "access_token": f"{config.access_token[:8]}..." if config.access_token else None,
             "refresh_token": "present" if config.refresh_token else "not set",
             "client_id": config.client_id or "not set",
         }
-    elif config.has_authorization_code_auth():
-        auth_method = "authorization_code"
-        is_authenticated = True
+    elif method is AuthMethod.AUTHORIZATION_CODE:
         details = {
             "method": "Authorization Code",
             "client_id": config.client_id,
             "redirect_uri": config.redirect_uri,
             "authorization_code": f"{config.authorization_code[:8]}..." if config.authorization_code else None,
         }
-    elif config.has_user_auth():
-        auth_method = "user"
-        is_authenticated = True
+    elif method is AuthMethod.USER:
         details = {
             "method": "User Credentials",
             "client_id": config.client_id,
             "username": config.username,
         }
-    elif config.has_app_auth():
-        auth_method = "app"
-        is_authenticated = True
+    elif method is AuthMethod.APP:
         details = {
             "method": "App Credentials",
             "client_id": config.client_id,
@@ -138,18 +169,19 @@ def auth_login(
     # Clear existing session if --force is specified
     if force:
         from dotenv import set_key
+        env_path = str(config.env_file_path)
         tokens_cleared = []
 
         if config.access_token:
-            set_key(str(config.env_file_path), "PODIO_ACCESS_TOKEN", "")
+            set_key(env_path, "PODIO_ACCESS_TOKEN", "")
             tokens_cleared.append("PODIO_ACCESS_TOKEN")
 
         if config.refresh_token:
-            set_key(str(config.env_file_path), "PODIO_REFRESH_TOKEN", "")
+            set_key(env_path, "PODIO_REFRESH_TOKEN", "")
             tokens_cleared.append("PODIO_REFRESH_TOKEN")
 
         if config.authorization_code:
-            set_key(str(config.env_file_path), "PODIO_AUTHORIZATION_CODE", "")
+            set_key(env_path, "PODIO_AUTHORIZATION_CODE", "")
             tokens_cleared.append("PODIO_AUTHORIZATION_CODE")
 
         if tokens_cleared:
@@ -174,6 +206,8 @@ def auth_login(
 
     # Generate URL based on auth type
     if auth_type == "client":
+        from pypodio2.transport import OAuthTokenAuthorization
+
         url = OAuthTokenAuthorization.get_authorization_url(
             client_id=config.client_id,
             redirect_uri=uri,
@@ -192,6 +226,8 @@ def auth_login(
         typer.echo("  PODIO_REFRESH_TOKEN=<refresh_token>", err=True)
 
     elif auth_type == "server":
+        from pypodio2.transport import OAuthAuthorizationCodeAuthorization
+
         url = OAuthAuthorizationCodeAuthorization.get_authorization_url(
             client_id=config.client_id,
             redirect_uri=uri,
@@ -236,27 +272,28 @@ def auth_logout(
     # Clear tokens from .env
     from dotenv import set_key
 
+    env_path = str(config.env_file_path)
     tokens_cleared = []
 
     if config.access_token:
-        set_key(str(config.env_file_path), "PODIO_ACCESS_TOKEN", "")
+        set_key(env_path, "PODIO_ACCESS_TOKEN", "")
         tokens_cleared.append("PODIO_ACCESS_TOKEN")
 
     if config.refresh_token:
-        set_key(str(config.env_file_path), "PODIO_REFRESH_TOKEN", "")
+        set_key(env_path, "PODIO_REFRESH_TOKEN", "")
         tokens_cleared.append("PODIO_REFRESH_TOKEN")
 
     if config.authorization_code:
-        set_key(str(config.env_file_path), "PODIO_AUTHORIZATION_CODE", "")
+        set_key(env_path, "PODIO_AUTHORIZATION_CODE", "")
         tokens_cleared.append("PODIO_AUTHORIZATION_CODE")
 
     if tokens_cleared:
         print_success(f"Cleared: {', '.join(tokens_cleared)}")
-        typer.echo(f"Updated: {config.env_file_path}", err=True)
+        typer.echo(f"Updated: {env_path}", err=True)
     else:
         typer.echo("No tokens to clear.", err=True)
 
-    print_json({"cleared": tokens_cleared, "env_file": str(config.env_file_path)})
+    print_json({"cleared": tokens_cleared, "env_file": env_path})
 
 
 @app.command("parse-callback")
@@ -275,18 +312,17 @@ def parse_callback(
         podio auth parse-callback "https://example.com/callback?code=abc123" --no-save
     """
     config = get_config()
+    env_path = str(config.env_file_path)
 
     try:
-        # Check if it's a client-side flow (fragment identifier with #)
-        if "#" in callback_url:
-            # Client-side flow - parse fragment
-            fragment = callback_url.split("#")[1]
-            params = {}
-            for param in fragment.split("&"):
-                if "=" in param:
-                    key, value = param.split("=", 1)
-                    params[key] = value
+        try:
+            parsed = _parse_oauth_callback(callback_url)
+        except ValueError as e:
+            print_error(str(e))
+            raise typer.Exit(1)
+        params = parsed.params
 
+        if parsed.kind == "token":
             if "access_token" not in params:
                 print_error("No access_token found in URL fragment")
                 raise typer.Exit(1)
@@ -295,10 +331,10 @@ def parse_callback(
 
             if save:
                 from dotenv import set_key
-                set_key(str(config.env_file_path), "PODIO_ACCESS_TOKEN", params["access_token"])
+                set_key(env_path, "PODIO_ACCESS_TOKEN", params["access_token"])
                 if params.get("refresh_token"):
-                    set_key(str(config.env_file_path), "PODIO_REFRESH_TOKEN", params["refresh_token"])
-                print_success(f"Tokens saved to {config.env_file_path}")
+                    set_key(env_path, "PODIO_REFRESH_TOKEN", params["refresh_token"])
+                print_success(f"Tokens saved to {env_path}")
 
             print_json({
                 "access_token": params.get("access_token"),
@@ -307,37 +343,26 @@ def parse_callback(
                 "saved": save,
             })
 
-        elif "?" in callback_url:
-            # Server-side flow - parse query string (authorization code)
-            query = callback_url.split("?")[1]
-            params = {}
-            for param in query.split("&"):
-                if "=" in param:
-                    key, value = param.split("=", 1)
-                    params[key] = value
-
-            if "code" in params:
-                typer.echo("\n✅ Authorization code extracted", err=True)
-
-                if save:
-                    from dotenv import set_key
-                    set_key(str(config.env_file_path), "PODIO_AUTHORIZATION_CODE", params["code"])
-                    print_success(f"Authorization code saved to {config.env_file_path}")
-
-                print_json({
-                    "authorization_code": params.get("code"),
-                    "saved": save,
-                })
-
-            elif "error" in params:
-                print_error(f"Authorization error: {params.get('error_description', params.get('error'))}")
-                raise typer.Exit(1)
-            else:
+        elif parsed.kind == "error":
+            print_error(f"Authorization error: {params.get('error_description', params.get('error'))}")
+            raise typer.Exit(1)
+
+        else:
+            if "code" not in params:
                 print_error("No authorization code found in query string")
                 raise typer.Exit(1)
-        else:
-            print_error("Invalid callback URL format. Expected URL with ? (query) or # (fragment)")
-            raise typer.Exit(1)
+
+            typer.echo("\n✅ Authorization code extracted", err=True)
+
+            if save:
+                from dotenv import set_key
+                set_key(env_path, "PODIO_AUTHORIZATION_CODE", params["code"])
+                print_success(f"Authorization code saved to {env_path}")
+
+            print_json({
+                "authorization_code": params.get("code"),
+                "saved": save,
+            })
 
     except typer.Exit:
         raise
@@ -1,52 +1,18 @@
 """Comment commands for Podio CLI."""
-import json
 import sys
-from typing import Optional, Any
+from typing import Optional
 from pathlib import Path
 import typer
 
+from .. import jsonio
+from ..cli_utils import read_stdin_text
 from ..client import get_client
-from ..output import print_json, print_output, print_error, print_success, handle_api_error, format_response
+from ..filters import apply_client_filter, apply_properties_filter
+from ..output import print_json, print_ndjson, print_output, print_error, print_success, handle_api_error, format_response
 
 app = typer.Typer(help="Manage Podio comments")
 
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
-    """Filter response data to include only specified properties."""
-    if not properties:
-        return data
-
-    prop_list = [p.strip() for p in properties.split(",")]
-
-    if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        return [{k: v for k, v in item.items() if k in prop_list} for item in data]
-
-    return data
-
-
-def _apply_client_filter(data: Any, filter_str: str) -> Any:
-    """Apply client-side filtering based on key:value pairs."""
-    if not filter_str or not isinstance(data, list):
-        return data
-
-    filters = {}
-    for part in filter_str.split(","):
-        if ":" in part:
-            key, value = part.split(":", 1)
-        elif "=" in part:
-            key, value = part.split("=", 1)
-        else:
-            continue
-        filters[key.strip()] = value.strip()
-
-    return [
-        item for item in data
-        if all(str(item.get(k, "")).lower() == v.lower() for k, v in filters.items())
-    ]
-
-
 @app.command("create")
 def create_comment(
     ref_type: str = typer.Argument(..., help="Object type (e.g., 'item', 'status')"),
@@ -91,23 +57,17 @@ def create_comment(
             if not json_file.exists():
                 print_error(f"File not found: {json_file}")
                 raise typer.Exit(1)
-            with open(json_file) as f:
-                comment_data = json.load(f)
+            comment_data = jsonio.load_file(json_file)
         elif text:
             comment_data = {"value": text}
         else:
             # Try reading from stdin
             if not sys.stdin.isatty():
-                try:
-                    stdin_data = sys.stdin.read().strip()
-                    if stdin_data:
-                        comment_data = {"value": stdin_data}
-                    else:
-                        print_error("No comment text provided. Use --text or --json-file")
-                        raise typer.Exit(1)
-                except Exception as e:
-                    print_error(f"Error reading from stdin: {e}")
+                stdin_data = read_stdin_text()
+                if not stdin_data:
+                    print_error("No comment text provided. Use --text or --json-file")
                     raise typer.Exit(1)
+                comment_data = {"value": stdin_data}
             else:
                 print_error("No comment text provided. Use --text or --json-file")
                 raise typer.Exit(1)
@@ -136,6 +96,7 @@ def list_comments(
     offset: int = typer.Option(0, "--offset", help="Offset for pagination"),
     filter: Optional[str] = typer.Option(None, "--filter", "-f", help="Filter by field:value"),
     properties: Optional[str] = typer.Option(None, "--properties", "-p", help="Comma-separated list of fields to include"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Output one JSON object per line"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
 ):
     """
@@ -146,8 +107,13 @@ def list_comments(
         podio comment list item 12345 --limit 50
         podio comment list item 12345 --filter "created_by.name:Adam"
         podio comment list item 12345 --properties "comment_id,value"
+        podio comment list item 12345 --ndjson | jq .value
         podio comment list item 12345 --table
     """
+    if ndjson and table:
+        print_error("--ndjson and --table cannot be used together")
+        raise typer.Exit(1)
+
     try:
         client = get_client()
         result = client.Comment.get_for_object(
@@ -160,13 +126,16 @@ def list_comments(
 
         # Apply client-side filtering
         if filter and isinstance(formatted, list):
-            formatted = _apply_client_filter(formatted, filter)
+            formatted = apply_client_filter(formatted, filter)
 
         # Apply properties filter
         if properties:
-            formatted = _apply_properties_filter(formatted, properties)
+            formatted = apply_properties_filter(formatted, properties)
 
-        print_output(formatted, table=table)
+        if ndjson:
+            print_ndjson(formatted)
+        else:
+            print_output(formatted, table=table)
     except Exception as e:
         exit_code = handle_api_error(e)
         raise typer.Exit(exit_code)
@@ -232,8 +201,7 @@ def update_comment(
             if not json_file.exists():
                 print_error(f"File not found: {json_file}")
                 raise typer.Exit(1)
-            with open(json_file) as f:
-                update_data = json.load(f)
+            update_data = jsonio.load_file(json_file)
         elif text:
             update_data = {"value": text}
         else:
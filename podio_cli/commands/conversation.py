@@ -1,12 +1,14 @@
 """Conversation (message) commands for Podio CLI."""
-import json
 import sys
-from typing import Optional, List, Any
+from typing import Any, Callable, Iterator, List, Optional
 from pathlib import Path
 import typer
 
+from .. import jsonio
+from ..cli_utils import parse_id_csv, read_stdin_text
 from ..client import get_client
-from ..output import print_json, print_output, print_error, print_success, print_warning, handle_api_error, format_response
+from ..filters import apply_list_pipeline
+from ..output import print_json, print_all_pages, print_ndjson, print_output, print_error, print_success, print_warning, handle_api_error, format_response, podio_command
 
 app = typer.Typer(help="Manage Podio conversations (messages)")
 
@@ -15,43 +17,35 @@ participant_app = typer.Typer(help="Manage conversation participants")
 app.add_typer(participant_app, name="participant")
 
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
-    """Filter response data to include only specified properties."""
-    if not properties:
-        return data
-
-    prop_list = [p.strip() for p in properties.split(",")]
-
-    if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        return [{k: v for k, v in item.items() if k in prop_list} for item in data]
-
-    return data
-
+def _fetch_all_pages(fetch: Callable[[int, int], Any], limit: int, offset: int) -> Iterator[List[Any]]:
+    """
+    Yield successive result pages, advancing the offset until an empty page.
 
-def _apply_client_filter(data: Any, filter_str: str) -> Any:
-    """Apply client-side filtering based on key:value pairs."""
-    if not filter_str or not isinstance(data, list):
-        return data
+    A short page is not taken as the end: the API caps how many results one
+    request returns, so a page can be short even when more results follow.
 
-    filters = {}
-    for part in filter_str.split(","):
-        if ":" in part:
-            key, value = part.split(":", 1)
-        elif "=" in part:
-            key, value = part.split("=", 1)
-        else:
-            continue
-        filters[key.strip()] = value.strip()
+    Args:
+        fetch: Callable taking (limit, offset) and returning one page
+        limit: Page size
+        offset: Offset of the first page
 
-    return [
-        item for item in data
-        if all(str(item.get(k, "")).lower() == v.lower() for k, v in filters.items())
-    ]
+    Yields:
+        Each non-empty page as a list
+    """
+    page_size = max(limit, 1)
+    while True:
+        page = format_response(fetch(page_size, offset))
+        if not isinstance(page, list):
+            yield [page]
+            return
+        if not page:
+            return
+        yield page
+        offset += len(page)
 
 
 @participant_app.command("add")
+@podio_command
 def participant_add(
     conversation_id: int = typer.Argument(..., help="Conversation ID"),
     users: str = typer.Option(..., "--users", "-u", help="Comma-separated list of user IDs to add"),
@@ -64,31 +58,28 @@ def participant_add(
         podio conversation participant add 12345 --users "123456,789012"
         podio conversation participant add 12345 -u "123456"
     """
-    try:
-        client = get_client()
+    client = get_client()
 
-        # Parse participants
-        try:
-            participant_ids = [int(p.strip()) for p in users.split(",")]
-        except ValueError:
-            print_error("Invalid user IDs. Must be comma-separated integers")
-            raise typer.Exit(1)
+    # Parse participants
+    participant_ids = parse_id_csv(users)
+    if participant_ids is None:
+        print_error("Invalid user IDs. Must be comma-separated integers")
+        raise typer.Exit(1)
 
-        result = client.Conversation.add_participants(conversation_id, participant_ids)
-        formatted = format_response(result)
-        print_success(f"Participants added to conversation {conversation_id}")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    result = client.Conversation.add_participants(conversation_id, participant_ids)
+    formatted = format_response(result)
+    print_success(f"Participants added to conversation {conversation_id}")
+    print_output(formatted, table=table)
 
 
 @app.command("list")
+@podio_command
 def list_conversations(
     limit: int = typer.Option(100, "--limit", "-l", help="Maximum conversations to return"),
     offset: int = typer.Option(0, "--offset", help="Offset for pagination"),
     filter: Optional[str] = typer.Option(None, "--filter", "-f", help="Filter by field:value"),
     properties: Optional[str] = typer.Option(None, "--properties", "-p", help="Comma-separated list of fields to include"),
+    all_pages: bool = typer.Option(False, "--all", help="Fetch every page (--limit is the page size) and stream results as NDJSON"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
 ):
     """
@@ -101,28 +92,29 @@ def list_conversations(
         podio conversation list --limit 20
         podio conversation list --filter "unread:true"
         podio conversation list --properties "conversation_id,subject"
+        podio conversation list --all > conversations.ndjson
         podio conversation list --table
     """
-    try:
-        client = get_client()
-        result = client.Conversation.find_all(limit=limit, offset=offset)
-        formatted = format_response(result)
+    client = get_client()
 
-        # Apply client-side filtering
-        if filter and isinstance(formatted, list):
-            formatted = _apply_client_filter(formatted, filter)
+    def trim(data: Any) -> Any:
+        return apply_list_pipeline(data, filter, properties)
 
-        # Apply properties filter
-        if properties:
-            formatted = _apply_properties_filter(formatted, properties)
+    if all_pages:
+        pages = _fetch_all_pages(
+            lambda page_limit, page_offset: client.Conversation.find_all(limit=page_limit, offset=page_offset),
+            limit,
+            offset,
+        )
+        print_all_pages(pages, table, transform=trim)
+        return
 
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    result = client.Conversation.find_all(limit=limit, offset=offset)
+    print_output(trim(format_response(result)), table=table)
 
 
 @app.command("get")
+@podio_command
 def get_conversation(
     conversation_id: int = typer.Argument(..., help="Conversation ID to retrieve"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -136,17 +128,14 @@ def get_conversation(
         podio conversation get 12345
         podio conversation get 12345 --table
     """
-    try:
-        client = get_client()
-        result = client.Conversation.find(conversation_id)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    result = client.Conversation.find(conversation_id)
+    formatted = format_response(result)
+    print_output(formatted, table=table)
 
 
 @app.command("create")
+@podio_command
 def create_conversation(
     subject: Optional[str] = typer.Option(None, "--subject", help="Conversation subject"),
     text: Optional[str] = typer.Option(None, "--text", help="Message text"),
@@ -191,53 +180,49 @@ def create_conversation(
         podio conversation create --ref-type item --ref-id 12345 --subject "Question" --text "Need help"
         podio conversation create --json-file conversation.json
     """
-    try:
-        client = get_client()
+    client = get_client()
 
-        # Build conversation data
-        if json_file:
-            if not json_file.exists():
-                print_error(f"File not found: {json_file}")
-                raise typer.Exit(1)
-            with open(json_file) as f:
-                conversation_data = json.load(f)
-        else:
-            if not subject or not text:
-                print_error("Missing required arguments. Provide --subject and --text or use --json-file")
-                raise typer.Exit(1)
+    # Build conversation data
+    if json_file:
+        try:
+            conversation_data = jsonio.load_file(json_file)
+        except FileNotFoundError:
+            print_error(f"File not found: {json_file}")
+            raise typer.Exit(1)
+    else:
+        if not subject or not text:
+            print_error("Missing required arguments. Provide --subject and --text or use --json-file")
+            raise typer.Exit(1)
 
-            conversation_data = {
-                "subject": subject,
-                "text": text,
-            }
-
-            # Parse participants if provided
-            if participants:
-                try:
-                    participant_ids = [int(p.strip()) for p in participants.split(",")]
-                    conversation_data["participants"] = participant_ids
-                except ValueError:
-                    print_error("Invalid participant IDs. Must be comma-separated integers")
-                    raise typer.Exit(1)
-
-        # Check if creating on object
-        if ref_type and ref_id:
-            result = client.Conversation.create_for(ref_type=ref_type, ref_id=ref_id, attributes=conversation_data)
-        else:
-            if not participants and "participants" not in conversation_data:
-                print_error("--participants is required for direct conversations (or use --ref-type and --ref-id for object conversations)")
+        conversation_data = {
+            "subject": subject,
+            "text": text,
+        }
+
+        # Parse participants if provided
+        if participants:
+            participant_ids = parse_id_csv(participants)
+            if participant_ids is None:
+                print_error("Invalid participant IDs. Must be comma-separated integers")
                 raise typer.Exit(1)
-            result = client.Conversation.create(attributes=conversation_data)
+            conversation_data["participants"] = participant_ids
+
+    # Check if creating on object
+    if ref_type and ref_id:
+        result = client.Conversation.create_for(ref_type=ref_type, ref_id=ref_id, attributes=conversation_data)
+    else:
+        if not participants and "participants" not in conversation_data:
+            print_error("--participants is required for direct conversations (or use --ref-type and --ref-id for object conversations)")
+            raise typer.Exit(1)
+        result = client.Conversation.create(attributes=conversation_data)
 
-        formatted = format_response(result)
-        print_success(f"Conversation created successfully")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    formatted = format_response(result)
+    print_success(f"Conversation created successfully")
+    print_output(formatted, table=table)
 
 
 @app.command("reply")
+@podio_command
 def reply_to_conversation(
     conversation_id: int = typer.Argument(..., help="Conversation ID"),
     text: Optional[str] = typer.Option(None, "--text", help="Reply text"),
@@ -264,42 +249,33 @@ def reply_to_conversation(
         podio conversation reply 12345 --json-file reply.json
         podio conversation reply 12345 --text "Thanks" --table
     """
-    try:
-        client = get_client()
+    client = get_client()
 
-        # Build reply data
-        if json_file:
-            if not json_file.exists():
-                print_error(f"File not found: {json_file}")
-                raise typer.Exit(1)
-            with open(json_file) as f:
-                reply_data = json.load(f)
-        elif text:
-            reply_data = {"text": text}
-        else:
-            # Try reading from stdin
-            if not sys.stdin.isatty():
-                try:
-                    stdin_data = sys.stdin.read().strip()
-                    if stdin_data:
-                        reply_data = {"text": stdin_data}
-                    else:
-                        print_error("No reply text provided. Use --text or --json-file")
-                        raise typer.Exit(1)
-                except Exception as e:
-                    print_error(f"Error reading from stdin: {e}")
-                    raise typer.Exit(1)
-            else:
+    # Build reply data
+    if json_file:
+        try:
+            reply_data = jsonio.load_file(json_file)
+        except FileNotFoundError:
+            print_error(f"File not found: {json_file}")
+            raise typer.Exit(1)
+    elif text:
+        reply_data = {"text": text}
+    else:
+        # Try reading from stdin
+        if not sys.stdin.isatty():
+            stdin_text = read_stdin_text()
+            if not stdin_text:
                 print_error("No reply text provided. Use --text or --json-file")
                 raise typer.Exit(1)
+            reply_data = {"text": stdin_text}
+        else:
+            print_error("No reply text provided. Use --text or --json-file")
+            raise typer.Exit(1)
 
-        result = client.Conversation.reply(conversation_id, attributes=reply_data)
-        formatted = format_response(result)
-        print_success(f"Reply sent to conversation {conversation_id}")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    result = client.Conversation.reply(conversation_id, attributes=reply_data)
+    formatted = format_response(result)
+    print_success(f"Reply sent to conversation {conversation_id}")
+    print_output(formatted, table=table)
 
 
 @app.command("add-participants", hidden=True)
@@ -314,6 +290,7 @@ def add_participants_deprecated(
 
 
 @app.command("mark-read")
+@podio_command
 def mark_as_read(
     conversation_id: int = typer.Argument(..., help="Conversation ID to mark as read"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -325,17 +302,165 @@ def mark_as_read(
         podio conversation mark-read 12345
         podio conversation mark-read 12345 --table
     """
-    try:
-        client = get_client()
-        client.Conversation.mark_as_read(conversation_id)
-        print_success(f"Conversation {conversation_id} marked as read")
-        print_output({"conversation_id": conversation_id, "marked_read": True}, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
+    client = get_client()
+    client.Conversation.mark_as_read(conversation_id)
+    print_success(f"Conversation {conversation_id} marked as read")
+    print_output({"conversation_id": conversation_id, "marked_read": True}, table=table)
+
+
+def _run_batch(ids: str, action: Callable[[Any, int], Any], verb: str, result_key: str, result_value: bool, concurrency: int, table: bool):
+    """
+    Apply a single-conversation action to a comma-separated list of IDs.
+
+    Requests are spread over a few parallel connections, each worker using
+    its own clone of the client, so N conversations take roughly
+    N / concurrency round trips instead of N. Results are output in the
+    order given; failures are reported per ID, as a row with
+    "updated": false, and do not stop the remaining IDs from being processed.
+
+    Args:
+        ids: Comma-separated conversation IDs
+        action: Callable taking (client, conversation_id)
+        verb: Past-tense description for messages (e.g., "marked as read")
+        result_key: Output key recording the outcome (e.g., "marked_read")
+        result_value: Value of result_key when the action succeeds
+        concurrency: Number of requests to run at once
+        table: If True, output as table
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    conversation_ids = parse_id_csv(ids)
+    if conversation_ids is None:
+        print_error("Invalid conversation IDs. Must be comma-separated integers")
+        raise typer.Exit(1)
+
+    client = get_client()
+    local = threading.local()
+
+    def run(conversation_id: int) -> Any:
+        # A client is not thread-safe; each worker gets its own connection
+        worker = getattr(local, "client", None)
+        if worker is None:
+            worker = local.client = client.clone()
+        return action(worker, conversation_id)
+
+    results = []
+    succeeded = 0
+    exit_code = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(run, conversation_id) for conversation_id in conversation_ids]
+        for conversation_id, future in zip(conversation_ids, futures):
+            try:
+                future.result()
+                results.append({"conversation_id": conversation_id, result_key: result_value})
+                succeeded += 1
+            except Exception as e:
+                print_warning(f"Conversation {conversation_id} could not be {verb}")
+                exit_code = handle_api_error(e)
+                results.append({"conversation_id": conversation_id, "updated": False})
+
+    print_success(f"{succeeded} of {len(results)} conversation(s) {verb}")
+    print_output(results, table=table)
+
+    if exit_code:
         raise typer.Exit(exit_code)
 
 
+# Options shared by the *-batch commands. Typer only reads these when
+# building the click parameters, so one instance can back every command.
+_IDS_OPTION = typer.Option(..., "--ids", help="Comma-separated list of conversation IDs")
+_CONCURRENCY_OPTION = typer.Option(4, "--concurrency", "-c", min=1, max=16, help="Number of requests to run at once")
+
+
+@app.command("mark-read-batch")
+@podio_command
+def mark_as_read_batch(
+    ids: str = _IDS_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+):
+    """
+    Mark several conversations as read in one invocation.
+
+    Authenticates once and sends the requests over a few parallel
+    connections, instead of paying start-up and a full round trip per ID as
+    a shell loop over 'mark-read' would.
+
+    Examples:
+        podio conversation mark-read-batch --ids "12345,67890"
+        podio conversation mark-read-batch --ids "12345,67890" --concurrency 8
+        podio conversation mark-read-batch --ids "12345,67890" --table
+    """
+    _run_batch(ids, lambda c, i: c.Conversation.mark_as_read(i), "marked as read", "marked_read", True, concurrency, table)
+
+
+@app.command("mark-unread-batch")
+@podio_command
+def mark_as_unread_batch(
+    ids: str = _IDS_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+):
+    """
+    Mark several conversations as unread in one invocation.
+
+    Examples:
+        podio conversation mark-unread-batch --ids "12345,67890"
+    """
+    _run_batch(ids, lambda c, i: c.Conversation.mark_as_unread(i), "marked as unread", "marked_unread", True, concurrency, table)
+
+
+@app.command("star-batch")
+@podio_command
+def star_conversation_batch(
+    ids: str = _IDS_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+):
+    """
+    Star several conversations in one invocation.
+
+    Examples:
+        podio conversation star-batch --ids "12345,67890"
+    """
+    _run_batch(ids, lambda c, i: c.Conversation.star(i), "starred", "starred", True, concurrency, table)
+
+
+@app.command("unstar-batch")
+@podio_command
+def unstar_conversation_batch(
+    ids: str = _IDS_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+):
+    """
+    Unstar several conversations in one invocation.
+
+    Examples:
+        podio conversation unstar-batch --ids "12345,67890"
+    """
+    _run_batch(ids, lambda c, i: c.Conversation.unstar(i), "unstarred", "starred", False, concurrency, table)
+
+
+@app.command("leave-batch")
+@podio_command
+def leave_conversation_batch(
+    ids: str = _IDS_OPTION,
+    concurrency: int = _CONCURRENCY_OPTION,
+    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+):
+    """
+    Leave several conversations in one invocation.
+
+    Examples:
+        podio conversation leave-batch --ids "12345,67890"
+    """
+    _run_batch(ids, lambda c, i: c.Conversation.leave(i), "left", "left", True, concurrency, table)
+
+
 @app.command("mark-unread")
+@podio_command
 def mark_as_unread(
     conversation_id: int = typer.Argument(..., help="Conversation ID to mark as unread"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -347,17 +472,14 @@ def mark_as_unread(
         podio conversation mark-unread 12345
         podio conversation mark-unread 12345 --table
     """
-    try:
-        client = get_client()
-        client.Conversation.mark_as_unread(conversation_id)
-        print_success(f"Conversation {conversation_id} marked as unread")
-        print_output({"conversation_id": conversation_id, "marked_unread": True}, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    client.Conversation.mark_as_unread(conversation_id)
+    print_success(f"Conversation {conversation_id} marked as unread")
+    print_output({"conversation_id": conversation_id, "marked_unread": True}, table=table)
 
 
 @app.command("star")
+@podio_command
 def star_conversation(
     conversation_id: int = typer.Argument(..., help="Conversation ID to star"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -369,17 +491,14 @@ def star_conversation(
         podio conversation star 12345
         podio conversation star 12345 --table
     """
-    try:
-        client = get_client()
-        client.Conversation.star(conversation_id)
-        print_success(f"Conversation {conversation_id} starred")
-        print_output({"conversation_id": conversation_id, "starred": True}, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    client.Conversation.star(conversation_id)
+    print_success(f"Conversation {conversation_id} starred")
+    print_output({"conversation_id": conversation_id, "starred": True}, table=table)
 
 
 @app.command("unstar")
+@podio_command
 def unstar_conversation(
     conversation_id: int = typer.Argument(..., help="Conversation ID to unstar"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -391,17 +510,14 @@ def unstar_conversation(
         podio conversation unstar 12345
         podio conversation unstar 12345 --table
     """
-    try:
-        client = get_client()
-        client.Conversation.unstar(conversation_id)
-        print_success(f"Conversation {conversation_id} unstarred")
-        print_output({"conversation_id": conversation_id, "starred": False}, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    client.Conversation.unstar(conversation_id)
+    print_success(f"Conversation {conversation_id} unstarred")
+    print_output({"conversation_id": conversation_id, "starred": False}, table=table)
 
 
 @app.command("leave")
+@podio_command
 def leave_conversation(
     conversation_id: int = typer.Argument(..., help="Conversation ID to leave"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -413,21 +529,20 @@ def leave_conversation(
         podio conversation leave 12345
         podio conversation leave 12345 --table
     """
-    try:
-        client = get_client()
-        client.Conversation.leave(conversation_id)
-        print_success(f"Left conversation {conversation_id}")
-        print_output({"conversation_id": conversation_id, "left": True}, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    client.Conversation.leave(conversation_id)
+    print_success(f"Left conversation {conversation_id}")
+    print_output({"conversation_id": conversation_id, "left": True}, table=table)
 
 
 @app.command("search")
+@podio_command
 def search_conversations(
     query: str = typer.Argument(..., help="Search query"),
     limit: int = typer.Option(10, "--limit", help="Maximum results to return"),
     offset: int = typer.Option(0, "--offset", help="Offset for pagination"),
+    all_pages: bool = typer.Option(False, "--all", help="Fetch every page (--limit is the page size) and stream results as NDJSON"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Output one JSON object per line (implied by --all)"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
 ):
     """
@@ -436,23 +551,40 @@ def search_conversations(
     Examples:
         podio conversation search "project update"
         podio conversation search "budget" --limit 20
+        podio conversation search "budget" --all --limit 100
+        podio conversation search "budget" --limit 500 --ndjson | jq -c .subject
         podio conversation search "project" --table
     """
-    try:
-        client = get_client()
-        result = client.Conversation.search(query, limit=limit, offset=offset)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    if ndjson and table:
+        print_error("--ndjson and --table cannot be used together")
+        raise typer.Exit(1)
+
+    client = get_client()
+    if all_pages:
+        pages = _fetch_all_pages(
+            lambda page_limit, page_offset: client.Conversation.search(query, limit=page_limit, offset=page_offset),
+            limit,
+            offset,
+        )
+        print_all_pages(pages, table)
+        return
+
+    result = client.Conversation.search(query, limit=limit, offset=offset)
+    formatted = format_response(result)
+    if ndjson:
+        print_ndjson(formatted)
+        return
+    print_output(formatted, table=table)
 
 
 @app.command("events")
+@podio_command
 def get_conversation_events(
     conversation_id: int = typer.Argument(..., help="Conversation ID"),
     limit: int = typer.Option(10, "--limit", help="Maximum events to return"),
     offset: int = typer.Option(0, "--offset", help="Offset for pagination"),
+    all_pages: bool = typer.Option(False, "--all", help="Fetch every page (--limit is the page size) and stream results as NDJSON"),
+    ndjson: bool = typer.Option(False, "--ndjson", help="Output one JSON object per line (implied by --all)"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
 ):
     """
@@ -461,19 +593,36 @@ def get_conversation_events(
     Examples:
         podio conversation events 12345
         podio conversation events 12345 --limit 50
+        podio conversation events 12345 --all --limit 100 > history.ndjson
+        podio conversation events 12345 --limit 1000 --ndjson | grep invoice
         podio conversation events 12345 --table
     """
-    try:
-        client = get_client()
-        result = client.Conversation.get_events(conversation_id, limit=limit, offset=offset)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    if ndjson and table:
+        print_error("--ndjson and --table cannot be used together")
+        raise typer.Exit(1)
+
+    client = get_client()
+    if all_pages:
+        pages = _fetch_all_pages(
+            lambda page_limit, page_offset: client.Conversation.get_events(
+                conversation_id, limit=page_limit, offset=page_offset
+            ),
+            limit,
+            offset,
+        )
+        print_all_pages(pages, table)
+        return
+
+    result = client.Conversation.get_events(conversation_id, limit=limit, offset=offset)
+    formatted = format_response(result)
+    if ndjson:
+        print_ndjson(formatted)
+        return
+    print_output(formatted, table=table)
 
 
 @app.command("on-object")
+@podio_command
 def get_conversations_on_object(
     ref_type: str = typer.Argument(..., help="Object type (e.g., 'item', 'status')"),
     ref_id: int = typer.Argument(..., help="Object ID"),
@@ -487,17 +636,14 @@ def get_conversations_on_object(
         podio conversation on-object status 67890
         podio conversation on-object item 12345 --table
     """
-    try:
-        client = get_client()
-        result = client.Conversation.get_on_object(ref_type, ref_id)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    result = client.Conversation.get_on_object(ref_type, ref_id)
+    formatted = format_response(result)
+    print_output(formatted, table=table)
 
 
 @app.command("create-on-object", hidden=True)
+@podio_command
 def create_conversation_on_object_deprecated(
     ref_type: str = typer.Argument(..., help="Object type (e.g., 'item', 'status')"),
     ref_id: int = typer.Argument(..., help="Object ID"),
@@ -521,39 +667,34 @@ def create_conversation_on_object_deprecated(
     Create a new conversation on a specific object.
     """
     print_warning("'podio conversation create-on-object' is deprecated. Use 'podio conversation create --ref-type <type> --ref-id <id>' instead.")
-    try:
-        client = get_client()
+    client = get_client()
 
-        # Build conversation data
-        if json_file:
-            if not json_file.exists():
-                print_error(f"File not found: {json_file}")
-                raise typer.Exit(1)
-            with open(json_file) as f:
-                conversation_data = json.load(f)
-        else:
-            if not subject or not text:
-                print_error("Missing required arguments. Provide --subject and --text or use --json-file")
+    # Build conversation data
+    if json_file:
+        try:
+            conversation_data = jsonio.load_file(json_file)
+        except FileNotFoundError:
+            print_error(f"File not found: {json_file}")
+            raise typer.Exit(1)
+    else:
+        if not subject or not text:
+            print_error("Missing required arguments. Provide --subject and --text or use --json-file")
+            raise typer.Exit(1)
+
+        conversation_data = {
+            "subject": subject,
+            "text": text,
+        }
+
+        # Parse participants if provided
+        if participants:
+            participant_ids = parse_id_csv(participants)
+            if participant_ids is None:
+                print_error("Invalid participant IDs. Must be comma-separated integers")
                 raise typer.Exit(1)
+            conversation_data["participants"] = participant_ids
 
-            conversation_data = {
-                "subject": subject,
-                "text": text,
-            }
-
-            # Parse participants if provided
-            if participants:
-                try:
-                    participant_ids = [int(p.strip()) for p in participants.split(",")]
-                    conversation_data["participants"] = participant_ids
-                except ValueError:
-                    print_error("Invalid participant IDs. Must be comma-separated integers")
-                    raise typer.Exit(1)
-
-        result = client.Conversation.create_on_object(ref_type, ref_id, attributes=conversation_data)
-        formatted = format_response(result)
-        print_success(f"Conversation created on {ref_type} {ref_id}")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    result = client.Conversation.create_on_object(ref_type, ref_id, attributes=conversation_data)
+    formatted = format_response(result)
+    print_success(f"Conversation created on {ref_type} {ref_id}")
+    print_output(formatted, table=table)
@@ -1,18 +1,68 @@
 """File commands for Podio CLI."""
 import json
+import os
+import stat
 import sys
+import tempfile
 from io import BytesIO
-from typing import Optional
+from typing import Any, Dict, Optional
 from pathlib import Path
 import typer
 
+from ..cli_utils import parse_id_csv
 from ..client import get_client
-from ..output import print_json, print_output, print_error, print_success, handle_api_error, format_response
+from ..output import print_json, print_output, print_error, print_success, print_warning, handle_api_error, format_response, podio_command
 
 app = typer.Typer(help="Manage Podio files")
 
+# Object types a file can be attached to (display order, and set for lookups)
+_VALID_REF_TYPES = ("item", "task", "comment", "status", "space")
+_VALID_REF_TYPE_SET = frozenset(_VALID_REF_TYPES)
+
+# Process umask, for giving new downloads the mode open() would. It can only
+# be read by setting it, so that is done once here rather than on the
+# download-batch worker threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _download_to(client: Any, file_id: int, output_path: Path) -> int:
+    """
+    Stream a file's raw content to disk.
+
+    The content is written chunk by chunk to a temporary file next to the
+    destination, so large files are never held in memory. The temporary file
+    replaces the destination only once the download has completed; on
+    failure it is removed and any existing file at output_path is untouched.
+    The result keeps the mode of the file it replaces, or gets the default
+    mode for new files under the current umask.
+
+    Args:
+        client: Podio API client
+        file_id: File ID to download
+        output_path: Destination path
+
+    Returns:
+        Number of bytes written
+    """
+    tmp = tempfile.NamedTemporaryFile(dir=output_path.parent, prefix=f".{output_path.name}.", delete=False)
+    try:
+        with tmp:
+            size = client.Files.download_raw(file_id=file_id, fileobj=tmp)
+        try:
+            mode = stat.S_IMODE(os.stat(output_path).st_mode)
+        except FileNotFoundError:
+            mode = 0o666 & ~_UMASK
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, output_path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+    return size
+
 
 @app.command("upload")
+@podio_command
 def upload_file(
     file_path: Path = typer.Argument(..., help="Path to file to upload"),
     filename: Optional[str] = typer.Option(
@@ -33,29 +83,26 @@ def upload_file(
         podio file upload document.docx --filename "My Document.docx"
         podio file upload document.docx --table
     """
-    try:
-        if not file_path.exists():
-            print_error(f"File not found: {file_path}")
-            raise typer.Exit(1)
-
-        client = get_client()
-
-        # Use provided filename or original
-        upload_filename = filename or file_path.name
-
-        # Open file as file object for multipart upload
-        with open(file_path, "rb") as f:
-            # Use the file object directly for proper multipart encoding
-            result = client.Files.create(filename=upload_filename, filedata=f)
-        formatted = format_response(result)
-        print_success(f"File uploaded successfully")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    if not file_path.exists():
+        print_error(f"File not found: {file_path}")
+        raise typer.Exit(1)
+
+    client = get_client()
+
+    # Use provided filename or original
+    upload_filename = filename or file_path.name
+
+    # Open file as file object for multipart upload
+    with open(file_path, "rb") as f:
+        # Use the file object directly for proper multipart encoding
+        result = client.Files.create(filename=upload_filename, filedata=f)
+    formatted = format_response(result)
+    print_success(f"File uploaded successfully")
+    print_output(formatted, table=table)
 
 
 @app.command("attach")
+@podio_command
 def attach_file(
     file_id: int = typer.Argument(..., help="File ID to attach"),
     ref_type: str = typer.Argument(..., help="Reference type: item, task, comment, status, or space"),
@@ -73,23 +120,19 @@ def attach_file(
         podio file attach 12345 comment 22222
         podio file attach 12345 item 67890 --table
     """
-    try:
-        valid_types = ["item", "task", "comment", "status", "space"]
-        if ref_type not in valid_types:
-            print_error(f"Invalid ref_type '{ref_type}'. Must be one of: {', '.join(valid_types)}")
-            raise typer.Exit(1)
-
-        client = get_client()
-        result = client.Files.attach(file_id=file_id, ref_type=ref_type, ref_id=ref_id)
-        formatted = format_response(result) if result else {"attached": True}
-        print_success(f"File {file_id} attached to {ref_type} {ref_id}")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    if ref_type not in _VALID_REF_TYPE_SET:
+        print_error(f"Invalid ref_type '{ref_type}'. Must be one of: {', '.join(_VALID_REF_TYPES)}")
+        raise typer.Exit(1)
+
+    client = get_client()
+    result = client.Files.attach(file_id=file_id, ref_type=ref_type, ref_id=ref_id)
+    formatted = format_response(result) if result else {"attached": True}
+    print_success(f"File {file_id} attached to {ref_type} {ref_id}")
+    print_output(formatted, table=table)
 
 
 @app.command("get")
+@podio_command
 def get_file(
     file_id: int = typer.Argument(..., help="File ID to retrieve"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -101,17 +144,14 @@ def get_file(
         podio file get 12345
         podio file get 12345 --table
     """
-    try:
-        client = get_client()
-        result = client.Files.find(file_id=file_id)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    result = client.Files.find(file_id=file_id)
+    formatted = format_response(result)
+    print_output(formatted, table=table)
 
 
 @app.command("download")
+@podio_command
 def download_file(
     file_id: int = typer.Argument(..., help="File ID to download"),
     output: Optional[Path] = typer.Option(
@@ -129,34 +169,104 @@ def download_file(
         podio file download 12345 --output ./my-document.docx
         podio file download 12345 --table
     """
-    try:
-        client = get_client()
+    client = get_client()
 
-        # Get file metadata first to get filename
+    # Determine output path; the metadata lookup is only needed for the
+    # original filename
+    if output is not None:
+        output_path = output
+    else:
         metadata = client.Files.find(file_id=file_id)
-        original_filename = metadata.get("name", f"file_{file_id}")
+        output_path = Path(metadata.get("name", f"file_{file_id}"))
+
+    size = _download_to(client, file_id, output_path)
+
+    print_success(f"File downloaded to: {output_path}")
+    print_output({"file_id": file_id, "filename": str(output_path), "size": size}, table=table)
+
+
+@app.command("download-batch")
+@podio_command
+def download_file_batch(
+    ids: str = typer.Option(..., "--ids", help="Comma-separated list of file IDs"),
+    out_dir: Path = typer.Option(Path("."), "--out-dir", "-d", help="Directory to save the files in"),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", min=1, max=16, help="Number of files to download at once"),
+    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+):
+    """
+    Download several files in one invocation.
+
+    Filenames are looked up first over the client's connection, then the file
+    contents are streamed to disk in parallel, so a large batch is limited by
+    bandwidth rather than by one round trip after another. Each file keeps the
+    final component of its original name (the file ID if that is empty); when
+    two files share a name the file ID is prepended.
+    Failures are reported per ID and do not stop the other downloads.
+
+    Examples:
+        podio file download-batch --ids "12345,67890"
+        podio file download-batch --ids "12345,67890" --out-dir ./attachments
+        podio file download-batch --ids "12345,67890" --concurrency 8 --table
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
 
-        # Download raw content
-        content = client.Files.find_raw(file_id=file_id)
+    file_ids = parse_id_csv(ids)
+    if file_ids is None:
+        print_error("Invalid file IDs. Must be comma-separated integers")
+        raise typer.Exit(1)
+    if not out_dir.is_dir():
+        print_error(f"Directory not found: {out_dir}")
+        raise typer.Exit(1)
 
-        # Determine output path
-        output_path = output or Path(original_filename)
+    client = get_client()
+    results: Dict[int, Dict[str, Any]] = {}
+    targets: Dict[int, Path] = {}
+    used_names = set()
+    exit_code = 0
 
-        # Write to file
-        with open(output_path, "wb") as f:
-            if isinstance(content, str):
-                f.write(content.encode())
+    # Metadata requests share the client's (non thread-safe) connection
+    for file_id in dict.fromkeys(file_ids):
+        try:
+            metadata = client.Files.find(file_id=file_id)
+        except Exception as e:
+            print_warning(f"File {file_id} could not be downloaded")
+            exit_code = handle_api_error(e)
+            results[file_id] = {"file_id": file_id, "downloaded": False}
+            continue
+        # Only the final path component is used, so a name such as
+        # "../../.bashrc" cannot write outside out_dir
+        name = Path(metadata.get("name") or "").name
+        if name in ("", ".."):
+            name = str(file_id)
+        if name in used_names:
+            name = f"{file_id}_{name}"
+        used_names.add(name)
+        targets[file_id] = out_dir / name
+
+    # Content downloads each open their own connection, so they can overlap
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(_download_to, client, file_id, path): file_id for file_id, path in targets.items()}
+        for future in as_completed(futures):
+            file_id = futures[future]
+            try:
+                size = future.result()
+            except Exception as e:
+                print_warning(f"File {file_id} could not be downloaded")
+                exit_code = handle_api_error(e)
+                results[file_id] = {"file_id": file_id, "downloaded": False}
             else:
-                f.write(content)
+                results[file_id] = {"file_id": file_id, "downloaded": True, "filename": str(targets[file_id]), "size": size}
+
+    succeeded = sum(1 for r in results.values() if r["downloaded"])
+    print_success(f"{succeeded} of {len(results)} file(s) downloaded to: {out_dir}")
+    print_output([results[file_id] for file_id in dict.fromkeys(file_ids)], table=table)
 
-        print_success(f"File downloaded to: {output_path}")
-        print_output({"file_id": file_id, "filename": str(output_path), "size": output_path.stat().st_size}, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
+    if exit_code:
         raise typer.Exit(exit_code)
 
 
 @app.command("copy")
+@podio_command
 def copy_file(
     file_id: int = typer.Argument(..., help="File ID to copy"),
     table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
@@ -170,12 +280,8 @@ def copy_file(
         podio file copy 12345
         podio file copy 12345 --table
     """
-    try:
-        client = get_client()
-        result = client.Files.copy(file_id=file_id)
-        formatted = format_response(result)
-        print_success(f"File {file_id} copied successfully")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    result = client.Files.copy(file_id=file_id)
+    formatted = format_response(result)
+    print_success(f"File {file_id} copied successfully")
+    print_output(formatted, table=table)
@@ -1,57 +1,118 @@
 """Item commands for Podio CLI."""
-import json
 import sys
-from typing import Optional, List, Any, Dict
+from typing import Optional, List, Any, Dict, Iterator
 from pathlib import Path
 import typer
 
+from .. import jsonio
+from ..cli_utils import parse_id_csv
 from ..client import get_client
-from ..output import print_json, print_output, print_error, print_success, print_warning, handle_api_error, format_response
+from ..filters import apply_properties_filter
+from ..output import print_json, print_all_pages, print_output, print_error, print_success, print_warning, handle_api_error, format_response, podio_command
 
 app = typer.Typer(help="Manage Podio items")
 
+# Options shared by several commands. Typer only reads these when building
+# the click parameters, so one instance can back every command.
+_TABLE_OPTION = typer.Option(False, "--table", "-t", help="Output as formatted table")
+_SILENT_OPTION = typer.Option(False, "--silent", help="Suppress Podio notifications")
+_NO_HOOK_OPTION = typer.Option(False, "--no-hook", help="Skip webhook execution")
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
+# Most items the item filter endpoint returns per request
+_FILTER_MAX_LIMIT = 500
+
+
+def _load_item_payload(json_file: Optional[Path], require_fields: bool = False) -> bytes:
     """
-    Filter response data to include only specified properties.
+    Read and validate an item payload from --json-file or stdin.
+
+    The document is parsed only to validate it. The original bytes are what
+    gets sent to Podio, so the payload is not re-serialized and the parsed
+    copy is released before the request is made.
 
     Args:
-        data: Response data (list of dicts or single dict)
-        properties: Comma-separated list of field names to include
+        json_file: Path to the JSON file, or None to read stdin
+        require_fields: If True, the payload must contain a 'fields' key
 
     Returns:
-        Filtered data with only specified properties
+        The JSON document as bytes
     """
-    if not properties:
-        return data
+    if json_file:
+        try:
+            raw = json_file.read_bytes()
+        except FileNotFoundError:
+            print_error(f"File not found: {json_file}")
+            raise typer.Exit(1)
+        source = str(json_file)
+    else:
+        raw = sys.stdin.buffer.read()
+        source = "stdin"
+
+    # A payload without "fields" anywhere in it cannot pass the check below,
+    # so reject it without paying for a full parse. The key can only be
+    # spelled differently with \u escapes; payloads containing any are parsed
+    # and checked as usual.
+    if require_fields and b'"fields"' not in raw and b"\\u" not in raw:
+        print_error("Item data must contain 'fields' key")
+        raise typer.Exit(1)
 
-    prop_list = [p.strip() for p in properties.split(",")]
+    try:
+        data = jsonio.loads(raw)
+    except jsonio.JSONDecodeError as e:
+        print_error(f"Invalid JSON from {source}: {e}")
+        raise typer.Exit(1)
 
-    if isinstance(data, dict):
-        if 'items' in data and isinstance(data['items'], list):
-            # Handle wrapped response
-            data['items'] = [
-                {k: v for k, v in item.items() if k in prop_list}
-                for item in data['items']
-            ]
-        else:
-            data = {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        data = [
-            {k: v for k, v in item.items() if k in prop_list}
-            for item in data
-        ]
+    if not isinstance(data, dict):
+        print_error("Item data must be a JSON object")
+        raise typer.Exit(1)
+
+    # Validate that we have fields
+    if require_fields and "fields" not in data:
+        print_error("Item data must contain 'fields' key")
+        raise typer.Exit(1)
+
+    return raw
 
-    return data
+
+def _filter_all_pages(client: Any, app_id: int, attributes: Dict[str, Any]) -> Iterator[List[Any]]:
+    """
+    Yield successive pages of filtered items, advancing the offset until done.
+
+    The same attributes dict is sent for every page; only its offset changes.
+    The page size is capped at what the API returns per request, and paging
+    stops once the offset reaches the response's "filtered" count (or, if
+    the count is missing, at the first empty page). A short page is not
+    taken as the end, since the API may return fewer items than asked for.
+
+    Args:
+        client: Podio API client
+        app_id: Application ID
+        attributes: Filter attributes, including limit (page size) and offset
+
+    Yields:
+        Each non-empty page of items as a list
+    """
+    attributes["limit"] = min(max(attributes["limit"], 1), _FILTER_MAX_LIMIT)
+    while True:
+        result = format_response(client.Item.filter(app_id=app_id, attributes=attributes))
+        items = result.get("items", []) if isinstance(result, dict) else result
+        if not items:
+            return
+        yield items
+        attributes["offset"] += len(items)
+        filtered = result.get("filtered") if isinstance(result, dict) else None
+        if isinstance(filtered, int) and attributes["offset"] >= filtered:
+            return
 
 
 @app.command("get")
+@podio_command
 def get_item(
     item_id: Optional[int] = typer.Argument(None, help="Item ID to retrieve"),
     external_id: Optional[str] = typer.Option(None, "--external-id", "-e", help="External ID to look up (requires --app-id)"),
     app_id: Optional[int] = typer.Option(None, "--app-id", "-a", help="App ID (required with --external-id)"),
     basic: bool = typer.Option(False, "--basic", help="Get basic item info only"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    table: bool = _TABLE_OPTION,
 ):
     """
     Get a Podio item by ID or external ID.
@@ -62,30 +123,88 @@ def get_item(
         podio item get --external-id my-custom-id --app-id 30543397
         podio item get 12345 --table
     """
-    try:
-        client = get_client()
-
-        if external_id:
-            # Look up by external ID
-            if not app_id:
-                print_error("--app-id is required when using --external-id")
-                raise typer.Exit(1)
-            result = client.Item.find_by_external_id(app_id=app_id, external_id=external_id)
-        elif item_id:
-            # Look up by item ID
-            result = client.Item.find(item_id=item_id, basic=basic)
-        else:
-            print_error("Either item_id argument or --external-id option is required")
+    client = get_client()
+
+    if external_id:
+        # Look up by external ID
+        if not app_id:
+            print_error("--app-id is required when using --external-id")
             raise typer.Exit(1)
+        result = client.Item.find_by_external_id(app_id=app_id, external_id=external_id)
+    elif item_id:
+        # Look up by item ID
+        result = client.Item.find(item_id=item_id, basic=basic)
+    else:
+        print_error("Either item_id argument or --external-id option is required")
+        raise typer.Exit(1)
+
+    formatted = format_response(result)
+    print_output(formatted, table=table)
+
+
+@app.command("get-batch")
+@podio_command
+def get_items_batch(
+    ids: str = typer.Option(..., "--ids", help="Comma-separated list of item IDs"),
+    basic: bool = typer.Option(False, "--basic", help="Get basic item info only"),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", min=1, max=16, help="Number of requests to run at once"),
+    table: bool = _TABLE_OPTION,
+):
+    """
+    Get several Podio items in one invocation.
+
+    Requests are spread over a few parallel connections, so fetching N items
+    takes roughly N / concurrency round trips instead of N. Items are output
+    in the order given; failures are reported per ID, as a row with
+    "retrieved": false in place of the item, and do not stop the remaining
+    requests.
+
+    Examples:
+        podio item get-batch --ids "12345,67890"
+        podio item get-batch --ids "12345,67890" --basic --concurrency 8
+        podio item get-batch --ids "12345,67890" --table
+    """
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    item_ids = parse_id_csv(ids)
+    if item_ids is None:
+        print_error("Invalid item IDs. Must be comma-separated integers")
+        raise typer.Exit(1)
+
+    client = get_client()
+    local = threading.local()
+
+    def fetch(item_id: int) -> Any:
+        # A client is not thread-safe; each worker gets its own connection
+        worker = getattr(local, "client", None)
+        if worker is None:
+            worker = local.client = client.clone()
+        return worker.Item.find(item_id=item_id, basic=basic)
+
+    results = []
+    succeeded = 0
+    exit_code = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(fetch, item_id) for item_id in item_ids]
+        for item_id, future in zip(item_ids, futures):
+            try:
+                results.append(format_response(future.result()))
+                succeeded += 1
+            except Exception as e:
+                print_warning(f"Item {item_id} could not be retrieved")
+                exit_code = handle_api_error(e)
+                results.append({"item_id": item_id, "retrieved": False})
 
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
+    print_success(f"{succeeded} of {len(results)} item(s) retrieved")
+    print_output(results, table=table)
+
+    if exit_code:
         raise typer.Exit(exit_code)
 
 
 @app.command("list")
+@podio_command
 def list_items(
     app_id: int = typer.Argument(..., help="Application ID to list items from"),
     filter: Optional[str] = typer.Option(
@@ -108,7 +227,8 @@ def list_items(
         help="Field to sort by",
     ),
     sort_desc: bool = typer.Option(False, "--desc", help="Sort in descending order"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    all_pages: bool = typer.Option(False, "--all", help="Fetch every page (--limit is the page size, at most 500) and stream items as NDJSON"),
+    table: bool = _TABLE_OPTION,
 ):
     """
     List items in a Podio application with optional filtering.
@@ -119,45 +239,48 @@ def list_items(
         podio item list 12345 --limit 50 --offset 0
         podio item list 12345 --sort-by "created_on" --desc
         podio item list 12345 --properties "item_id,title,status"
+        podio item list 12345 --all --limit 500 > items.ndjson
         podio item list 12345 --table
     """
-    try:
-        client = get_client()
+    client = get_client()
+
+    # Build filter attributes
+    attributes = {
+        "limit": limit,
+        "offset": offset,
+    }
+
+    # Parse JSON filters if provided
+    if filter:
+        try:
+            filter_dict = jsonio.loads(filter)
+            attributes["filters"] = filter_dict
+        except jsonio.JSONDecodeError as e:
+            print_error(f"Invalid JSON in --filter: {e}")
+            raise typer.Exit(1)
 
-        # Build filter attributes
-        attributes = {
-            "limit": limit,
-            "offset": offset,
-        }
+    # Add sorting if specified
+    if sort_by:
+        attributes["sort_by"] = sort_by
+        attributes["sort_desc"] = sort_desc
 
-        # Parse JSON filters if provided
-        if filter:
-            try:
-                filter_dict = json.loads(filter)
-                attributes["filters"] = filter_dict
-            except json.JSONDecodeError as e:
-                print_error(f"Invalid JSON in --filter: {e}")
-                raise typer.Exit(1)
-
-        # Add sorting if specified
-        if sort_by:
-            attributes["sort_by"] = sort_by
-            attributes["sort_desc"] = sort_desc
-
-        result = client.Item.filter(app_id=app_id, attributes=attributes)
-        formatted = format_response(result)
-
-        # Apply properties filter if specified
-        if properties:
-            formatted = _apply_properties_filter(formatted, properties)
-
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    if all_pages:
+        trim = (lambda page: apply_properties_filter(page, properties)) if properties else None
+        print_all_pages(_filter_all_pages(client, app_id, attributes), table, transform=trim)
+        return
+
+    result = client.Item.filter(app_id=app_id, attributes=attributes)
+    formatted = format_response(result)
+
+    # Apply properties filter if specified
+    if properties:
+        formatted = apply_properties_filter(formatted, properties)
+
+    print_output(formatted, table=table)
 
 
 @app.command("create")
+@podio_command
 def create_item(
     app_id: int = typer.Argument(..., help="Application ID to create item in"),
     json_file: Optional[Path] = typer.Option(
@@ -166,8 +289,8 @@ def create_item(
         help="Path to JSON file with item data",
     ),
     silent: bool = typer.Option(True, "--silent/--notify", help="Suppress Podio notifications (default: silent)"),
-    no_hook: bool = typer.Option(False, "--no-hook", help="Skip webhook execution"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    no_hook: bool = _NO_HOOK_OPTION,
+    table: bool = _TABLE_OPTION,
 ):
     """
     Create a new item in a Podio application.
@@ -188,43 +311,23 @@ def create_item(
         cat item.json | podio item create 12345
         podio item create 12345 --json-file item.json --table
     """
-    try:
-        client = get_client()
-
-        # Read item data from file or stdin
-        if json_file:
-            if not json_file.exists():
-                print_error(f"File not found: {json_file}")
-                raise typer.Exit(1)
-            with open(json_file) as f:
-                item_data = json.load(f)
-        else:
-            # Read from stdin
-            try:
-                item_data = json.load(sys.stdin)
-            except json.JSONDecodeError as e:
-                print_error(f"Invalid JSON from stdin: {e}")
-                raise typer.Exit(1)
-
-        # Validate that we have fields
-        if "fields" not in item_data:
-            print_error("Item data must contain 'fields' key")
-            raise typer.Exit(1)
+    client = get_client()
 
-        result = client.Item.create(
-            app_id=app_id,
-            attributes=item_data,
-            silent=silent,
-            hook=not no_hook
-        )
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    # Read item data from file or stdin
+    item_data = _load_item_payload(json_file, require_fields=True)
+
+    result = client.Item.create(
+        app_id=app_id,
+        attributes=item_data,
+        silent=silent,
+        hook=not no_hook
+    )
+    formatted = format_response(result)
+    print_output(formatted, table=table)
 
 
 @app.command("update")
+@podio_command
 def update_item(
     item_id: int = typer.Argument(..., help="Item ID to update"),
     json_file: Optional[Path] = typer.Option(
@@ -232,9 +335,9 @@ def update_item(
         "--json-file",
         help="Path to JSON file with update data",
     ),
-    silent: bool = typer.Option(False, "--silent", help="Suppress Podio notifications"),
-    no_hook: bool = typer.Option(False, "--no-hook", help="Skip webhook execution"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    silent: bool = _SILENT_OPTION,
+    no_hook: bool = _NO_HOOK_OPTION,
+    table: bool = _TABLE_OPTION,
 ):
     """
     Update an existing Podio item.
@@ -253,44 +356,29 @@ def update_item(
         cat update.json | podio item update 12345
         podio item update 12345 --json-file update.json --table
     """
-    try:
-        client = get_client()
-
-        # Read update data from file or stdin
-        if json_file:
-            if not json_file.exists():
-                print_error(f"File not found: {json_file}")
-                raise typer.Exit(1)
-            with open(json_file) as f:
-                update_data = json.load(f)
-        else:
-            # Read from stdin
-            try:
-                update_data = json.load(sys.stdin)
-            except json.JSONDecodeError as e:
-                print_error(f"Invalid JSON from stdin: {e}")
-                raise typer.Exit(1)
-
-        result = client.Item.update(
-            item_id=item_id,
-            attributes=update_data,
-            silent=silent,
-            hook=not no_hook
-        )
-        formatted = format_response(result)
-        print_success(f"Item {item_id} updated successfully")
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+
+    # Read update data from file or stdin
+    update_data = _load_item_payload(json_file)
+
+    result = client.Item.update(
+        item_id=item_id,
+        attributes=update_data,
+        silent=silent,
+        hook=not no_hook
+    )
+    formatted = format_response(result)
+    print_success(f"Item {item_id} updated successfully")
+    print_output(formatted, table=table)
 
 
 @app.command("delete")
+@podio_command
 def delete_item(
     item_id: int = typer.Argument(..., help="Item ID to delete"),
-    silent: bool = typer.Option(False, "--silent", help="Suppress Podio notifications"),
-    no_hook: bool = typer.Option(False, "--no-hook", help="Skip webhook execution"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    silent: bool = _SILENT_OPTION,
+    no_hook: bool = _NO_HOOK_OPTION,
+    table: bool = _TABLE_OPTION,
 ):
     """
     Delete a Podio item.
@@ -300,20 +388,17 @@ def delete_item(
         podio item delete 12345 --silent
         podio item delete 12345 --table
     """
-    try:
-        client = get_client()
-        client.Item.delete(item_id=item_id, silent=silent, hook=not no_hook)
-        print_success(f"Item {item_id} deleted successfully")
-        print_output({"item_id": item_id, "deleted": True}, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    client.Item.delete(item_id=item_id, silent=silent, hook=not no_hook)
+    print_success(f"Item {item_id} deleted successfully")
+    print_output({"item_id": item_id, "deleted": True}, table=table)
 
 
 @app.command("values")
+@podio_command
 def get_item_values(
     item_id: int = typer.Argument(..., help="Item ID to get values from"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    table: bool = _TABLE_OPTION,
 ):
     """
     Get field values for a specific item.
@@ -324,21 +409,18 @@ def get_item_values(
         podio item values 12345
         podio item values 12345 --table
     """
-    try:
-        client = get_client()
-        result = client.Item.values_v2(item_id=item_id)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    result = client.Item.values_v2(item_id=item_id)
+    formatted = format_response(result)
+    print_output(formatted, table=table)
 
 
 @app.command("field-value")
+@podio_command
 def get_field_value(
     item_id: int = typer.Argument(..., help="Item ID to get field value from"),
     field: str = typer.Argument(..., help="Field ID or external_id to retrieve"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    table: bool = _TABLE_OPTION,
 ):
     """
     Get a specific field's values for an item (v2 endpoint).
@@ -352,21 +434,18 @@ def get_field_value(
         podio item field-value 12345 potential-writer
         podio item field-value 12345 potential-writer --table
     """
-    try:
-        client = get_client()
-        result = client.Item.field_value_v2(item_id=item_id, field_or_external_id=field)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    result = client.Item.field_value_v2(item_id=item_id, field_or_external_id=field)
+    formatted = format_response(result)
+    print_output(formatted, table=table)
 
 
 @app.command("get-by-external-id", hidden=True)
+@podio_command
 def get_item_by_external_id(
     app_id: int = typer.Argument(..., help="Application ID"),
     external_id: str = typer.Argument(..., help="External ID of the item"),
-    table: bool = typer.Option(False, "--table", "-t", help="Output as formatted table"),
+    table: bool = _TABLE_OPTION,
 ):
     """
     [DEPRECATED] Use 'podio item get --external-id <id> --app-id <app_id>' instead.
@@ -374,11 +453,7 @@ def get_item_by_external_id(
     Get a Podio item by external ID within a specific app.
     """
     print_warning("'podio item get-by-external-id' is deprecated. Use 'podio item get --external-id <id> --app-id <app_id>' instead.")
-    try:
-        client = get_client()
-        result = client.Item.find_by_external_id(app_id=app_id, external_id=external_id)
-        formatted = format_response(result)
-        print_output(formatted, table=table)
-    except Exception as e:
-        exit_code = handle_api_error(e)
-        raise typer.Exit(exit_code)
+    client = get_client()
+    result = client.Item.find_by_external_id(app_id=app_id, external_id=external_id)
+    formatted = format_response(result)
+    print_output(formatted, table=table)
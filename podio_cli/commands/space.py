@@ -1,29 +1,15 @@
 """Space commands for Podio CLI."""
 import typer
-from typing import Optional, Any
+from typing import Optional
 
 from ..client import get_client
 from ..config import get_config
+from ..filters import apply_list_pipeline
 from ..output import print_json, print_output, print_error, print_warning, handle_api_error, format_response
 
 app = typer.Typer(help="Manage Podio spaces")
 
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
-    """Filter response data to include only specified properties."""
-    if not properties:
-        return data
-
-    prop_list = [p.strip() for p in properties.split(",")]
-
-    if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        return [{k: v for k, v in item.items() if k in prop_list} for item in data]
-
-    return data
-
-
 @app.command("get")
 def get_space(
     space_id: Optional[int] = typer.Option(None, "--space-id", "-s", help="Space ID to retrieve (defaults to PODIO_WORKSPACE_ID)"),
@@ -66,27 +52,6 @@ def get_space(
         raise typer.Exit(exit_code)
 
 
-def _apply_client_filter(data: Any, filter_str: str) -> Any:
-    """Apply client-side filtering based on key:value pairs."""
-    if not filter_str or not isinstance(data, list):
-        return data
-
-    filters = {}
-    for part in filter_str.split(","):
-        if ":" in part:
-            key, value = part.split(":", 1)
-        elif "=" in part:
-            key, value = part.split("=", 1)
-        else:
-            continue
-        filters[key.strip()] = value.strip()
-
-    return [
-        item for item in data
-        if all(str(item.get(k, "")).lower() == v.lower() for k, v in filters.items())
-    ]
-
-
 @app.command("list")
 def list_spaces(
     org_id: Optional[int] = typer.Option(None, "--org-id", "-o", help="Organization ID to list spaces from (defaults to PODIO_ORGANIZATION_ID)"),
@@ -122,17 +87,8 @@ def list_spaces(
         result = client.Space.find_all_for_org(org_id=org_id)
         formatted = format_response(result)
 
-        # Apply client-side filtering
-        if filter and isinstance(formatted, list):
-            formatted = _apply_client_filter(formatted, filter)
-
-        # Apply limit (client-side)
-        if isinstance(formatted, list) and len(formatted) > limit:
-            formatted = formatted[:limit]
-
-        # Apply properties filter
-        if properties:
-            formatted = _apply_properties_filter(formatted, properties)
+        # Apply filter, limit and properties (client-side) in a single pass
+        formatted = apply_list_pipeline(formatted, filter, properties, limit)
 
         print_output(formatted, table=table)
     except Exception as e:
@@ -1,74 +1,53 @@
 """Task commands for Podio CLI."""
-import json
 import sys
-from typing import Optional, List, Any
+from typing import Optional, List
 from pathlib import Path
 import typer
 
+from .. import jsonio
 from ..client import get_client
+from ..filters import apply_field_filters, apply_list_pipeline
 from ..output import print_json, print_output, print_error, print_success, print_warning, handle_api_error, format_response
 
 app = typer.Typer(help="Manage Podio tasks")
 
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
-    """Filter response data to include only specified properties."""
-    if not properties:
-        return data
+# Task status values and the /task/ "completed" parameter that selects them
+_STATUS_TO_COMPLETED = {"active": False, "completed": True}
 
-    prop_list = [p.strip() for p in properties.split(",")]
 
-    if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        return [{k: v for k, v in item.items() if k in prop_list} for item in data]
-
-    return data
+def _push_down_filters(filters: List[str], params: dict) -> List[str]:
+    """
+    Move filters the /task/ endpoint can apply itself into the request params.
 
+    A status equality filter (status:completed, status:eq:active) becomes the
+    completed parameter, so Podio only returns matching tasks and --limit
+    counts matching tasks rather than everything fetched. An explicit
+    --completed takes precedence.
 
-def _apply_client_filter(data: List[dict], filters: List[str]) -> List[dict]:
-    """Apply client-side filtering for cases where API doesn't support filtering."""
-    if not filters or not isinstance(data, list):
-        return data
+    Args:
+        filters: --filter values (field:value or field:op:value)
+        params: Query parameters for GET /task/, updated in place
 
-    result = data
+    Returns:
+        The filters that still have to be applied client-side
+    """
+    remaining = []
     for f in filters:
         parts = f.split(":", 2)
-        if len(parts) < 2:
-            continue
-
-        field = parts[0]
-        if len(parts) == 2:
-            # field:value format (exact match)
-            op, value = "eq", parts[1]
+        if len(parts) == 3 and parts[1] == "eq":
+            parts = [parts[0], parts[2]]
+        if (
+            len(parts) == 2
+            and parts[0] == "status"
+            and parts[1].lower() in _STATUS_TO_COMPLETED
+            and "completed" not in params
+        ):
+            params["completed"] = _STATUS_TO_COMPLETED[parts[1].lower()]
         else:
-            # field:op:value format
-            op, value = parts[1], parts[2]
-
-        filtered = []
-        for item in result:
-            item_value = item.get(field)
-            if item_value is None:
-                continue
-
-            # Convert to string for comparison
-            item_str = str(item_value).lower()
-            value_str = value.lower()
-
-            if op == "eq" and item_str == value_str:
-                filtered.append(item)
-            elif op == "ne" and item_str != value_str:
-                filtered.append(item)
-            elif op == "contains" and value_str in item_str:
-                filtered.append(item)
-            elif op == "gt" and item_str > value_str:
-                filtered.append(item)
-            elif op == "lt" and item_str < value_str:
-                filtered.append(item)
-
-        result = filtered
-
-    return result
+            remaining.append(f)
+    return remaining
+
 
 # Subcommand group for label operations
 label_app = typer.Typer(help="Manage task labels")
@@ -120,6 +99,8 @@ def list_tasks(
             params["responsible"] = responsible
         if space:
             params["space"] = space
+        if filter:
+            filter = _push_down_filters(filter, params)
 
         # Use raw transport for task listing
         result = client.transport.GET(url="/task/", **params)
@@ -127,15 +108,10 @@ def list_tasks(
 
         # Apply client-side filter if specified
         if filter:
-            formatted = _apply_client_filter(formatted, filter)
+            formatted = apply_field_filters(formatted, filter)
 
-        # Apply limit (client-side as backup)
-        if isinstance(formatted, list) and len(formatted) > limit:
-            formatted = formatted[:limit]
-
-        # Apply properties filter
-        if properties:
-            formatted = _apply_properties_filter(formatted, properties)
+        # Apply limit and properties (client-side) in a single pass
+        formatted = apply_list_pipeline(formatted, None, properties, limit)
 
         print_output(formatted, table=table)
     except Exception as e:
@@ -205,17 +181,12 @@ def label_update(
     try:
         client = get_client()
 
-        # Parse labels - could be IDs or names
-        label_list_parsed = [l.strip() for l in labels.split(",")]
-
-        # Try to convert to integers if they look like IDs
-        parsed_labels: List = []
-        for label in label_list_parsed:
-            try:
-                parsed_labels.append(int(label))
-            except ValueError:
-                # It's a label name, keep as string
-                parsed_labels.append(label)
+        # Parse labels - could be IDs or names. All-digit entries are label
+        # IDs; anything else is a label name and is kept as a string.
+        parsed_labels: List = [
+            int(label) if label.isdecimal() else label
+            for label in (l.strip() for l in labels.split(","))
+        ]
 
         result = client.Task.update_labels(task_id=task_id, labels=parsed_labels)
         formatted = format_response(result)
@@ -319,15 +290,20 @@ def create_task(
         if json_file or (not sys.stdin.isatty() and not text):
             # Read from file or stdin
             if json_file:
-                if not json_file.exists():
+                try:
+                    task_data = jsonio.load_file(json_file)
+                except FileNotFoundError:
                     print_error(f"File not found: {json_file}")
                     raise typer.Exit(1)
-                with open(json_file) as f:
-                    task_data = json.load(f)
             else:
+                raw = sys.stdin.buffer.read()
+                if not raw.strip():
+                    # Nothing was piped in (e.g., an empty file or /dev/null)
+                    print_error("Either --text or --json-file/stdin is required")
+                    raise typer.Exit(1)
                 try:
-                    task_data = json.load(sys.stdin)
-                except json.JSONDecodeError as e:
+                    task_data = jsonio.loads(raw)
+                except jsonio.JSONDecodeError as e:
                     print_error(f"Invalid JSON from stdin: {e}")
                     raise typer.Exit(1)
         else:
@@ -336,13 +312,13 @@ def create_task(
                 print_error("Either --text or --json-file/stdin is required")
                 raise typer.Exit(1)
 
+            # text and private are always sent; the rest only when given
             task_data = {"text": text, "private": private}
-            if ref_type:
-                task_data["ref_type"] = ref_type
-            if ref_id:
-                task_data["ref_id"] = ref_id
-            if due_date:
-                task_data["due_date"] = due_date
+            task_data.update(
+                (key, value)
+                for key, value in (("ref_type", ref_type), ("ref_id", ref_id), ("due_date", due_date))
+                if value
+            )
 
         result = client.Task.create(attributes=task_data)
         formatted = format_response(result)
@@ -430,15 +406,20 @@ def update_task(
         if json_file or (not sys.stdin.isatty() and not text):
             # Read from file or stdin
             if json_file:
-                if not json_file.exists():
+                try:
+                    update_data = jsonio.load_file(json_file)
+                except FileNotFoundError:
                     print_error(f"File not found: {json_file}")
                     raise typer.Exit(1)
-                with open(json_file) as f:
-                    update_data = json.load(f)
             else:
+                raw = sys.stdin.buffer.read()
+                if not raw.strip():
+                    # Nothing was piped in (e.g., an empty file or /dev/null)
+                    print_error("Provide --text, --due-date, or --json-file/stdin")
+                    raise typer.Exit(1)
                 try:
-                    update_data = json.load(sys.stdin)
-                except json.JSONDecodeError as e:
+                    update_data = jsonio.loads(raw)
+                except jsonio.JSONDecodeError as e:
                     print_error(f"Invalid JSON from stdin: {e}")
                     raise typer.Exit(1)
         else:
@@ -447,11 +428,7 @@ def update_task(
                 print_error("Provide --text, --due-date, or --json-file/stdin")
                 raise typer.Exit(1)
 
-            update_data = {}
-            if text:
-                update_data["text"] = text
-            if due_date:
-                update_data["due_date"] = due_date
+            update_data = {key: value for key, value in (("text", text), ("due_date", due_date)) if value}
 
         result = client.Task.update(task_id=task_id, attributes=update_data)
         formatted = format_response(result)
@@ -3,12 +3,13 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Optional, Any, List
+from typing import Optional, List
 
-import requests
 import typer
 
+from .. import jsonio
 from ..client import get_client
+from ..filters import apply_field_filters, apply_list_pipeline
 from ..output import print_json, print_output, print_error, print_success, print_info, handle_api_error, format_response
 
 app = typer.Typer(help="Manage Podio webforms")
@@ -21,65 +22,14 @@ app.add_typer(field_app, name="field")
 attachments_app = typer.Typer(help="Manage webform file attachments")
 app.add_typer(attachments_app, name="attachments")
 
+# CSRF token in the webform page: a <meta> tag, or the bootstrap data JSON
+_CSRF_META_RE = re.compile(r'<meta\s+name="csrf-token"\s+content="([^"]+)"')
+_CSRF_BOOTSTRAP_RE = re.compile(r'"csrfToken"\s*:\s*"([^"]+)"')
+# Characters at the top of the page searched before scanning all of it
+_CSRF_HEAD_SIZE = 16 * 1024
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
-    """Filter response data to include only specified properties."""
-    if not properties:
-        return data
-
-    prop_list = [p.strip() for p in properties.split(",")]
-
-    if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        return [{k: v for k, v in item.items() if k in prop_list} for item in data]
-
-    return data
-
-
-def _apply_client_filter(data: list, filters: list) -> list:
-    """Apply client-side filtering using field:op:value syntax."""
-    if not filters or not isinstance(data, list):
-        return data
-
-    result = data
-    for f in filters:
-        parts = f.split(":", 2)
-        if len(parts) < 2:
-            continue
-
-        field = parts[0]
-        if len(parts) == 2:
-            # field:value format (exact match)
-            op, value = "eq", parts[1]
-        else:
-            # field:op:value format
-            op, value = parts[1], parts[2]
-
-        filtered = []
-        for item in result:
-            item_value = item.get(field)
-            if item_value is None:
-                continue
-
-            # Convert to string for comparison
-            item_str = str(item_value).lower()
-            value_str = value.lower()
-
-            if op == "eq" and item_str == value_str:
-                filtered.append(item)
-            elif op == "ne" and item_str != value_str:
-                filtered.append(item)
-            elif op == "contains" and value_str in item_str:
-                filtered.append(item)
-            elif op == "gt" and item_str > value_str:
-                filtered.append(item)
-            elif op == "lt" and item_str < value_str:
-                filtered.append(item)
-
-        result = filtered
-
-    return result
+# /webforms/{app_id}/{form_id} in a webform URL
+_WEBFORM_URL_RE = re.compile(r'/webforms/(\d+)/(\d+)')
 
 
 @app.command("list")
@@ -114,15 +64,10 @@ def list_webforms(
 
         # Apply client-side filter if specified
         if filter:
-            formatted = _apply_client_filter(formatted, filter)
+            formatted = apply_field_filters(formatted, filter)
 
-        # Apply limit (client-side)
-        if isinstance(formatted, list) and len(formatted) > limit:
-            formatted = formatted[:limit]
-
-        # Apply properties filter
-        if properties:
-            formatted = _apply_properties_filter(formatted, properties)
+        # Apply limit and properties (client-side) in a single pass
+        formatted = apply_list_pipeline(formatted, None, properties, limit)
 
         print_output(formatted, table=table)
     except Exception as e:
@@ -156,16 +101,18 @@ def get_webform(
 
 
 def _extract_csrf_token(html: str) -> Optional[str]:
-    """Extract CSRF token from webform HTML."""
-    # Try meta tag first
-    meta_match = re.search(r'<meta\s+name="csrf-token"\s+content="([^"]+)"', html)
-    if meta_match:
-        return meta_match.group(1)
+    """Extract CSRF token from webform HTML.
 
-    # Try bootstrap data JSON
-    bootstrap_match = re.search(r'"csrfToken"\s*:\s*"([^"]+)"', html)
-    if bootstrap_match:
-        return bootstrap_match.group(1)
+    The token is normally in the page head, so the first _CSRF_HEAD_SIZE
+    characters are searched before falling back to the whole page.
+    """
+    for endpos in (_CSRF_HEAD_SIZE, len(html)):
+        # Try meta tag first, then bootstrap data JSON
+        match = _CSRF_META_RE.search(html, 0, endpos) or _CSRF_BOOTSTRAP_RE.search(html, 0, endpos)
+        if match:
+            return match.group(1)
+        if endpos >= len(html):
+            break
 
     return None
 
@@ -178,7 +125,7 @@ def _parse_webform_url(url: str) -> tuple[int, int]:
     Returns:
         Tuple of (app_id, form_id)
     """
-    match = re.search(r'/webforms/(\d+)/(\d+)', url)
+    match = _WEBFORM_URL_RE.search(url)
     if not match:
         raise ValueError(f"Invalid webform URL format: {url}")
     return int(match.group(1)), int(match.group(2))
@@ -256,6 +203,10 @@ def submit_webform(
         podio webform submit https://podio.com/webforms/30560419/2584779 -f data.json -a file1.pdf -a file2.docx
         echo '{"title": "Test"}' | podio webform submit https://podio.com/webforms/30560419/2584779
     """
+    # requests is only needed here; importing it at module level would add its
+    # import cost to every podio command, since main.py loads all command modules
+    import requests
+
     try:
         # Parse the webform URL
         try:
@@ -283,8 +234,7 @@ def submit_webform(
             if not json_file.exists():
                 print_error(f"File not found: {json_file}")
                 raise typer.Exit(1)
-            with open(json_file) as f:
-                fields_data = json.load(f)
+            fields_data = jsonio.load_file(json_file)
         else:
             # Read from stdin
             if sys.stdin.isatty():
@@ -292,8 +242,8 @@ def submit_webform(
                 fields_data = {}
             else:
                 try:
-                    fields_data = json.load(sys.stdin)
-                except json.JSONDecodeError as e:
+                    fields_data = jsonio.loads(sys.stdin.buffer.read())
+                except jsonio.JSONDecodeError as e:
                     print_error(f"Invalid JSON from stdin: {e}")
                     raise typer.Exit(1)
 
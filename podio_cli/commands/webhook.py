@@ -2,9 +2,10 @@
 import typer
 import sys
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional
 
 from ..client import get_client
+from ..filters import apply_client_filter, apply_properties_filter
 from ..output import print_json, print_output, print_success, print_warning, handle_api_error, format_response
 
 app = typer.Typer(help="Manage Podio webhooks")
@@ -14,42 +15,6 @@ field_app = typer.Typer(help="Manage field-level webhooks")
 app.add_typer(field_app, name="field")
 
 
-def _apply_properties_filter(data: Any, properties: str) -> Any:
-    """Filter response data to include only specified properties."""
-    if not properties:
-        return data
-
-    prop_list = [p.strip() for p in properties.split(",")]
-
-    if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in prop_list}
-    elif isinstance(data, list):
-        return [{k: v for k, v in item.items() if k in prop_list} for item in data]
-
-    return data
-
-
-def _apply_client_filter(data: Any, filter_str: str) -> Any:
-    """Apply client-side filtering based on key:value pairs."""
-    if not filter_str or not isinstance(data, list):
-        return data
-
-    filters = {}
-    for part in filter_str.split(","):
-        if ":" in part:
-            key, value = part.split(":", 1)
-        elif "=" in part:
-            key, value = part.split("=", 1)
-        else:
-            continue
-        filters[key.strip()] = value.strip()
-
-    return [
-        item for item in data
-        if all(str(item.get(k, "")).lower() == v.lower() for k, v in filters.items())
-    ]
-
-
 @field_app.command("create")
 def field_create(
     field_id: int = typer.Argument(..., help="Field ID to create webhook for"),
@@ -282,7 +247,7 @@ def list_webhooks(
 
         # Apply client-side filtering
         if filter and isinstance(formatted, list):
-            formatted = _apply_client_filter(formatted, filter)
+            formatted = apply_client_filter(formatted, filter)
 
         # Apply limit (client-side)
         if isinstance(formatted, list) and len(formatted) > limit:
@@ -290,7 +255,7 @@ def list_webhooks(
 
         # Apply properties filter
         if properties:
-            formatted = _apply_properties_filter(formatted, properties)
+            formatted = apply_properties_filter(formatted, properties)
 
         print_output(formatted, table=table)
 
@@ -1,9 +1,20 @@
 """Configuration management for Podio CLI."""
 import os
+from enum import Enum
 from pathlib import Path
-from typing import Optional
-from dotenv import load_dotenv
-from pypodio2 import RetryConfig
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from pypodio2 import RetryConfig
+
+
+class AuthMethod(str, Enum):
+    """Authentication methods, in the order they are preferred."""
+
+    TOKEN = "token"
+    AUTHORIZATION_CODE = "authorization_code"
+    USER = "user"
+    APP = "app"
 
 
 class Config:
@@ -12,17 +23,24 @@ class Config:
     def __init__(self):
         """Initialize configuration by loading from .env file."""
         # Always use the .env file from the CLI source directory (relative to this file)
-        self._retry_config: Optional[RetryConfig] = None
+        self._retry_config: Optional["RetryConfig"] = None
         
         # Use resolve() to get absolute path regardless of current working directory
         self.env_file_path = Path(__file__).resolve().parent.parent / ".env"
         
         if self.env_file_path.exists():
+            # Imported here so that --help and argument errors, which never
+            # build a Config, don't pay for python-dotenv (and logging)
+            from dotenv import load_dotenv
+
             load_dotenv(self.env_file_path, override=True)
         else:
             # Create the .env file if it doesn't exist
             self.env_file_path.touch()
 
+        # Resolve the preferred auth method once, after the environment is loaded
+        self.auth_method: Optional[AuthMethod] = self._detect_auth_method()
+
     @property
     def client_id(self) -> Optional[str]:
         """Get Podio client ID."""
@@ -114,19 +132,24 @@ class Config:
         """Check if access token authentication is available."""
         return bool(self.access_token)
 
+    def _detect_auth_method(self) -> Optional[AuthMethod]:
+        """Return the first fully configured auth method, or None."""
+        if self.has_token_auth():
+            return AuthMethod.TOKEN
+        if self.has_authorization_code_auth():
+            return AuthMethod.AUTHORIZATION_CODE
+        if self.has_user_auth():
+            return AuthMethod.USER
+        if self.has_app_auth():
+            return AuthMethod.APP
+        return None
+
     def get_missing_credentials(self) -> list[str]:
         """Get list of missing credentials for any authentication method."""
         missing = []
 
         # Check if any complete auth method is available
-        has_complete_auth = (
-            self.has_authorization_code_auth() or 
-            self.has_user_auth() or 
-            self.has_app_auth() or 
-            self.has_token_auth()
-        )
-
-        if has_complete_auth:
+        if self.auth_method is not None:
             return missing  # No missing credentials if we have a complete auth method
 
         # No complete auth found, list what's needed
@@ -164,7 +187,7 @@ class Config:
         # Read existing .env file content
         env_content = {}
         if self.env_file_path.exists():
-            with open(self.env_file_path, 'r') as f:
+            with open(self.env_file_path, 'r', encoding='utf-8') as f:
                 for line in f:
                     line = line.strip()
                     if line and not line.startswith('#') and '=' in line:
@@ -176,11 +199,11 @@ class Config:
         env_content['PODIO_REFRESH_TOKEN'] = refresh_token
 
         # Write back to file
-        with open(self.env_file_path, 'w') as f:
+        with open(self.env_file_path, 'w', encoding='utf-8') as f:
             for key, value in env_content.items():
                 f.write(f"{key}={value}\n")
 
-    def get_retry_config(self) -> RetryConfig:
+    def get_retry_config(self) -> "RetryConfig":
         """
         Build (and cache) the retry configuration for outbound Podio requests.
 
@@ -195,6 +218,8 @@ class Config:
         if self._retry_config is not None:
             return self._retry_config
 
+        from pypodio2 import RetryConfig
+
         max_retries = self._get_int_env("PODIO_RETRY_MAX_ATTEMPTS", default=5, minimum=0)
         base_delay = self._get_float_env("PODIO_RETRY_BASE_DELAY", default=2.0, minimum=0.001)
         max_delay = self._get_float_env("PODIO_RETRY_MAX_DELAY", default=60.0, minimum=base_delay)
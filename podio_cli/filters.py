@@ -0,0 +1,242 @@
+"""Client-side filtering and projection of API responses for Podio CLI."""
+import functools
+import operator
+import re
+from itertools import islice
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+
+# One key:value (or key=value) pair of a --filter string. The key ends at the
+# first separator, so values may contain ':' or '=' (e.g., URLs); segments
+# without a separator are skipped.
+_FILTER_RE = re.compile(r"\s*([^,:=]+?)\s*[:=]\s*([^,]*?)\s*(?:,|$)")
+
+# Comparison for each field:op:value filter operator, called as
+# compare(item_value, value) on the lower-cased strings
+_FIELD_FILTER_OPS = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "contains": lambda item_value, value: value in item_value,
+    "gt": operator.gt,
+    "lt": operator.lt,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_properties(properties: str) -> Tuple[str, ...]:
+    """
+    Parse a --properties string.
+
+    Args:
+        properties: Comma-separated list of field names
+
+    Returns:
+        Field names in the order given, with duplicates dropped
+    """
+    return tuple(dict.fromkeys(p.strip() for p in properties.split(",")))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_filter(filter_str: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Parse a --filter string of comma-separated key:value (or key=value) pairs.
+
+    Args:
+        filter_str: Filter string (e.g., "name:ATA,status:active")
+
+    Returns:
+        (key, value) pairs with the values lower-cased for comparison; a
+        repeated key keeps its last value. Flag checks (unread:true,
+        starred:false, ...) come first: they usually reject most rows, and
+        the compiled predicate stops at the first pair that fails.
+    """
+    pairs = ((k, v.lower()) for k, v in dict(_FILTER_RE.findall(filter_str)).items())
+    return tuple(sorted(pairs, key=lambda pair: pair[1] not in ("true", "false")))
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_filter(filter_str: str) -> Callable[[Any], bool]:
+    """
+    Build a predicate testing a row against a --filter string.
+
+    Args:
+        filter_str: Filter string (e.g., "name:ATA,status:active")
+
+    Returns:
+        Callable returning True if every key:value pair matches the row
+        (case-insensitively)
+    """
+    filters = _parse_filter(filter_str)
+    if len(filters) == 1:
+        # The usual case: compare a single field without looping over pairs
+        ((key, value),) = filters
+        return lambda item: str(item.get(key, "")).lower() == value
+    return lambda item: all(str(item.get(k, "")).lower() == v for k, v in filters)
+
+
+def apply_client_filter(data: Any, filter_str: Optional[str]) -> Any:
+    """
+    Keep the rows matching a --filter string of key:value (or key=value) pairs.
+
+    Args:
+        data: Response data; anything but a list is returned unchanged
+        filter_str: Filter string (e.g., "name:ATA,status:active")
+
+    Returns:
+        Rows whose fields equal every given value (case-insensitively)
+    """
+    if not filter_str or not isinstance(data, list):
+        return data
+    return list(filter(_compile_filter(filter_str), data))
+
+
+def apply_properties_filter(data: Any, properties: Optional[str]) -> Any:
+    """
+    Filter response data to include only specified properties.
+
+    Items are projected by looking up the requested keys, so the cost per
+    item depends on how many fields were asked for rather than how many the
+    item has. Keys come out in the order they were requested; when every item
+    already has exactly that shape, the list is returned as is.
+
+    Args:
+        data: Response data (list of dicts, single dict, or a dict wrapping
+            an 'items' list)
+        properties: Comma-separated list of field names to include
+
+    Returns:
+        Filtered data with only specified properties
+    """
+    if not properties:
+        return data
+
+    prop_keys = _parse_properties(properties)
+
+    if isinstance(data, dict):
+        if 'items' in data and isinstance(data['items'], list):
+            # Handle wrapped response
+            data['items'] = _project_rows(data['items'], prop_keys)
+        else:
+            data = {k: data[k] for k in prop_keys if k in data}
+    elif isinstance(data, list):
+        data = _project_rows(data, prop_keys)
+
+    return data
+
+
+def _project_rows(rows: List[Any], prop_keys: Tuple[str, ...]) -> List[Any]:
+    """
+    Project each row of a list onto the requested keys.
+
+    Args:
+        rows: List of dicts
+        prop_keys: Field names to keep
+
+    Returns:
+        Projected rows, or rows itself if every row already holds only
+        requested keys, in the requested order
+    """
+    # The key set check allocates nothing and usually fails on the first row;
+    # only if it passes are the rows' key orders compared, so the result never
+    # depends on whether a row happened to need rebuilding
+    prop_set = frozenset(prop_keys)
+    if all(map(prop_set.issuperset, rows)) and all(
+        list(item) == [k for k in prop_keys if k in item] for item in rows
+    ):
+        return rows
+    return [{k: item[k] for k in prop_keys if k in item} for item in rows]
+
+
+def apply_list_pipeline(
+    data: Any, filter_str: Optional[str], properties: Optional[str], limit: Optional[int] = None
+) -> Any:
+    """
+    Apply --filter, --limit and --properties to response data in one pass.
+
+    Rows are matched, counted and projected as they are visited, and the walk
+    stops as soon as limit rows have been kept.
+
+    Args:
+        data: Response data (list of dicts or single dict)
+        filter_str: Comma-separated key:value pairs rows must match (lists only)
+        properties: Comma-separated list of fields to include
+        limit: Maximum number of rows to return (lists only), or None for all
+
+    Returns:
+        Filtered, limited and projected data
+    """
+    prop_keys = _parse_properties(properties) if properties else None
+
+    if isinstance(data, dict):
+        if prop_keys is None:
+            return data
+        return {k: data[k] for k in prop_keys if k in data}
+    if not isinstance(data, list):
+        return data
+
+    if not filter_str and limit is None:
+        # Nothing to match or count; only the projection remains
+        return data if prop_keys is None else _project_rows(data, prop_keys)
+
+    rows: Iterable[Any] = data
+    if filter_str:
+        rows = filter(_compile_filter(filter_str), rows)
+    if limit is not None:
+        rows = islice(rows, max(limit, 0))
+    if prop_keys is not None:
+        rows = ({k: item[k] for k in prop_keys if k in item} for item in rows)
+    return list(rows)
+
+
+def apply_field_filters(data: Any, filters: Optional[List[str]]) -> Any:
+    """
+    Apply client-side filtering using field:value or field:op:value syntax.
+
+    Supported operators are eq (the default), ne, contains, gt and lt, all
+    compared case-insensitively as strings. Every filter is parsed once and
+    each row is dropped at the first filter it fails, so no intermediate
+    list is built per filter.
+
+    Args:
+        data: Response data; anything but a list is returned unchanged
+        filters: --filter values (e.g., ["status:active", "name:contains:Contact"])
+
+    Returns:
+        Rows matching every filter
+    """
+    if not filters or not isinstance(data, list):
+        return data
+
+    # Parse every filter once into (field, compare, lower-cased value)
+    predicates = []
+    for f in filters:
+        parts = f.split(":", 2)
+        if len(parts) < 2:
+            continue
+
+        if len(parts) == 2:
+            # field:value format (exact match)
+            field, op, value = parts[0], "eq", parts[1]
+        else:
+            # field:op:value format
+            field, op, value = parts
+
+        compare = _FIELD_FILTER_OPS.get(op)
+        if compare is None:
+            # An unknown operator matches nothing
+            return []
+        predicates.append((field, compare, value.lower()))
+
+    if not predicates:
+        return data
+
+    def matches(item: dict) -> bool:
+        for field, compare, value in predicates:
+            item_value = item.get(field)
+            # Items without the field never match
+            if item_value is None or not compare(str(item_value).lower(), value):
+                return False
+        return True
+
+    # One pass over the data, stopping at the first filter an item fails
+    return [item for item in data if matches(item)]
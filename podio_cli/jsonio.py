@@ -0,0 +1,122 @@
+"""JSON encoding and decoding helpers for Podio CLI.
+
+Uses orjson when it is installed (``pip install podio-cli[fast]``) and falls
+back to the standard library json module otherwise.
+"""
+import json
+import mmap
+import os
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can keep
+# catching json.JSONDecodeError regardless of which parser is active.
+JSONDecodeError = json.JSONDecodeError
+
+# Files at least this large are parsed straight from a memory map
+MMAP_THRESHOLD = 1024 * 1024
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Accepts raw bytes so callers can read files in binary mode and skip the
+    text decoding step.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as e:
+        # orjson reports malformed UTF-8 as a JSONDecodeError; do the same so
+        # callers only need to catch one exception type with either parser
+        raise JSONDecodeError(f"Invalid UTF-8: {e.reason}", "", e.start) from None
+
+
+def load_file(path: Union[str, "os.PathLike[str]"]) -> Any:
+    """
+    Read and parse a JSON file.
+
+    With orjson available, large regular files are memory-mapped and parsed
+    directly from the page cache instead of being copied into a bytes object
+    first. Small files, pipes and other non-mappable inputs are read normally.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        OSError: If the file cannot be opened (e.g., FileNotFoundError)
+        JSONDecodeError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        if orjson is not None:
+            try:
+                size = os.fstat(f.fileno()).st_size
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size >= MMAP_THRESHOLD else None
+            except (OSError, ValueError):
+                mapped = None
+            if mapped is not None:
+                with mapped:
+                    view = memoryview(mapped)
+                    try:
+                        return orjson.loads(view)
+                    finally:
+                        view.release()
+        return loads(f.read())
+
+
+def dumps(data: Any, indent: Optional[int] = 2, newline: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Non-ASCII characters are written as-is (no \\u escapes), matching
+    ``json.dumps(..., ensure_ascii=False)``.
+
+    Args:
+        data: Data to serialize
+        indent: Indentation level, or None for compact single-line output
+        newline: If True, terminate the document with a newline
+
+    Returns:
+        JSON document as bytes
+
+    Raises:
+        TypeError: If the data contains values that cannot be serialized
+    """
+    # orjson only supports a 2-space indent
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            # Appended by the encoder itself, saving a copy of the output
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # e.g. integers wider than 64 bits; let the stdlib encoder decide
+            pass
+
+    separators = None if indent else (",", ":")
+    text = json.dumps(data, indent=indent, ensure_ascii=False, separators=separators)
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
@@ -1,15 +1,37 @@
 """Output formatting and error handling for Podio CLI."""
+import functools
 import json
+import os
 import sys
-from typing import Any, List, Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Iterable, List, Dict, Optional
 
-from rich.console import Console
-from rich.table import Table
-from rich import box
+import typer
 
+from . import jsonio
 
-# Rich console for table output - use wide width to prevent truncation
-console = Console(width=200)
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Rich console for table output, created on first use so that commands
+# printing JSON never import rich
+_console: Optional["Console"] = None
+
+
+def _get_console() -> "Console":
+    """
+    Get the rich console used for table output.
+
+    Returns:
+        Console instance, created on first call
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        # Use wide width to prevent truncation
+        _console = Console(width=200)
+    return _console
 
 
 def _flatten_item(item: Dict) -> Dict:
@@ -65,6 +87,11 @@ def print_table(data: Any, title: Optional[str] = None, columns: Optional[List[s
         title: Optional table title
         columns: Optional list of column names to display in order (bypasses auto-ordering)
     """
+    from rich.table import Table
+    from rich import box
+
+    console = _get_console()
+
     if data is None:
         console.print("[dim]No data[/dim]")
         return
@@ -215,6 +242,36 @@ def print_output(data: Any, table: bool = False, indent: int = 2):
         print_json(data, indent)
 
 
+def _write_stdout(payload: bytes):
+    """
+    Write already-encoded output straight to the stdout byte stream.
+
+    Args:
+        payload: UTF-8 encoded bytes to write
+    """
+    out = sys.stdout
+    buffer = getattr(out, "buffer", None)
+    if buffer is None:
+        # stdout has been replaced by a text-only stream
+        out.write(payload.decode("utf-8"))
+        return
+    # Keep ordering with anything already written through the text layer
+    out.flush()
+    try:
+        fd = out.fileno()
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a real file (e.g. captured output in tests)
+        fd = None
+    if fd is not None and not out.isatty():
+        # Piped or redirected: hand the bytes straight to the OS instead of
+        # copying them through the buffered writer first
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        return
+    buffer.write(payload)
+
+
 def print_json(data: Any, indent: int = 2):
     """
     Print data as formatted JSON to stdout.
@@ -224,11 +281,53 @@ def print_json(data: Any, indent: int = 2):
         indent: JSON indentation level (default: 2)
     """
     try:
-        json_str = json.dumps(data, indent=indent, ensure_ascii=False)
-        print(json_str)
+        payload = jsonio.dumps(data, indent=indent, newline=True)
     except (TypeError, ValueError) as e:
         print_error(f"Failed to serialize data to JSON: {e}")
         sys.exit(1)
+    _write_stdout(payload)
+
+
+def print_ndjson(data: Any):
+    """
+    Print data as newline-delimited JSON (one compact object per line) to stdout.
+
+    Each record is written and flushed as soon as it is serialized, so
+    downstream tools can start consuming before the whole list is written.
+
+    Args:
+        data: List of records to output (a single value is written as one line)
+    """
+    records = data if isinstance(data, list) else [data]
+    try:
+        for record in records:
+            _write_stdout(jsonio.dumps(record, indent=None, newline=True))
+            sys.stdout.flush()
+    except (TypeError, ValueError) as e:
+        print_error(f"Failed to serialize data to JSON: {e}")
+        sys.exit(1)
+
+
+def print_all_pages(pages: Iterable[List[Any]], table: bool, transform: Optional[Callable[[List[Any]], Any]] = None):
+    """
+    Output every page of an --all listing: streamed as NDJSON, or collected
+    into one table.
+
+    Args:
+        pages: Iterable of result pages
+        table: If True, collect all rows and print a single table
+        transform: Optional callable applied to each page before output
+    """
+    collected: List[Any] = []
+    for page in pages:
+        if transform:
+            page = transform(page)
+        if table:
+            collected.extend(page)
+        else:
+            print_ndjson(page)
+    if table:
+        print_output(collected, table=True)
 
 
 def print_error(message: str):
@@ -364,6 +463,33 @@ def handle_api_error(error: Exception) -> int:
     return 1
 
 
+def podio_command(func: Callable) -> Callable:
+    """
+    Decorator for command handlers that turns uncaught errors into exit codes.
+
+    Replaces the per-command ``try: ... except Exception as e:
+    raise typer.Exit(handle_api_error(e))`` boilerplate. Explicit
+    ``typer.Exit`` raised by the handler passes through unchanged. Apply it
+    below the ``@app.command(...)`` decorator.
+
+    Args:
+        func: Command handler to wrap
+
+    Returns:
+        Wrapped handler with the same signature
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except typer.Exit:
+            raise
+        except Exception as e:
+            raise typer.Exit(handle_api_error(e))
+
+    return wrapper
+
+
 def format_response(data: Any) -> Any:
     """
     Format API response data for output.
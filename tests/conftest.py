@@ -0,0 +1,23 @@
+"""
+Shared fixtures. Commands get their API client from
+podio_cli.client.get_client(), which returns the module-level client
+once one is set, so tests install a Mock there instead of
+authenticating.
+"""
+from unittest.mock import MagicMock
+
+import pytest
+
+import podio_cli.client
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    A mocked Podio client. clone() returns the same mock, so calls made
+    from worker threads are recorded on it too.
+    """
+    mock_client = MagicMock()
+    mock_client.clone.return_value = mock_client
+    monkeypatch.setattr(podio_cli.client, "_client", mock_client)
+    return mock_client
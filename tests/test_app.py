@@ -0,0 +1,17 @@
+"""
+Tests for podio_cli.commands.app, run through the CLI with a mocked
+client.
+"""
+from tests.utils import invoke, json_output
+
+
+def test_list_applies_field_filters(client):
+    client.Application.list_in_space.return_value = [
+        {"app_id": 1, "status": "active", "config": {"name": "Contacts"}},
+        {"app_id": 2, "status": "inactive", "config": {"name": "Leads"}},
+    ]
+
+    result = invoke("app", "list", "--space-id", 5, "--filter", "status:active")
+
+    assert result.exit_code == 0
+    assert [app["app_id"] for app in json_output(result)] == [1]
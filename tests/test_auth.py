@@ -0,0 +1,37 @@
+"""
+Tests for podio_cli.commands.auth.
+"""
+import pytest
+
+from podio_cli.commands.auth import ParsedCallback, _parse_oauth_callback
+
+
+def test_parse_callback_fragment_tokens():
+    url = "https://localhost/cb#access_token=abc%2F1&refresh_token=def&expires_in=28800"
+
+    assert _parse_oauth_callback(url) == ParsedCallback(
+        "token", {"access_token": "abc/1", "refresh_token": "def", "expires_in": "28800"})
+
+
+def test_parse_callback_query_code():
+    url = "https://localhost/cb?code=xyz&state=s1"
+
+    assert _parse_oauth_callback(url) == ParsedCallback("code", {"code": "xyz", "state": "s1"})
+
+
+def test_parse_callback_query_error():
+    url = "https://localhost/cb?error=access_denied&error_description=User+denied"
+
+    assert _parse_oauth_callback(url) == ParsedCallback(
+        "error", {"error": "access_denied", "error_description": "User denied"})
+
+
+def test_parse_callback_fragment_wins_over_query():
+    url = "https://localhost/cb?state=s1#access_token=abc"
+
+    assert _parse_oauth_callback(url).kind == "token"
+
+
+def test_parse_callback_without_parameters():
+    with pytest.raises(ValueError):
+        _parse_oauth_callback("https://localhost/cb")
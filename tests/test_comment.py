@@ -0,0 +1,21 @@
+"""
+Tests for podio_cli.commands.comment, run through the CLI with a mocked
+client.
+"""
+from tests.utils import invoke
+
+
+def test_create_reads_text_from_stdin(client):
+    client.Comment.create.return_value = {"comment_id": 1}
+
+    result = invoke("comment", "create", "item", 5, input=b"Looks good\n")
+
+    assert result.exit_code == 0
+    assert client.Comment.create.call_args.kwargs["attributes"] == {"value": "Looks good"}
+
+
+def test_list_ndjson_and_table_conflict(client):
+    result = invoke("comment", "list", "item", 5, "--ndjson", "--table")
+
+    assert result.exit_code == 1
+    assert not client.Comment.get_for_object.called
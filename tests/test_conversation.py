@@ -0,0 +1,136 @@
+"""
+Tests for podio_cli.commands.conversation, run through the CLI with a
+mocked client.
+"""
+from tests.utils import invoke, json_output, ndjson_output
+
+
+def paged_find_all(total, max_limit):
+    """
+    Returns a stand-in for Conversation.find_all serving `total`
+    conversations, at most `max_limit` per request.
+    """
+    def find_all(limit, offset):
+        end = min(offset + min(limit, max_limit), total)
+        return [{"conversation_id": i, "unread": i % 2 == 0} for i in range(offset, end)]
+    return find_all
+
+
+def test_list_all_pages_past_endpoint_cap(client):
+    client.Conversation.find_all.side_effect = paged_find_all(250, max_limit=100)
+
+    result = invoke("conversation", "list", "--all", "--limit", 200)
+
+    assert result.exit_code == 0
+    assert [row["conversation_id"] for row in ndjson_output(result)] == list(range(250))
+    offsets = [c.kwargs["offset"] for c in client.Conversation.find_all.call_args_list]
+    assert offsets == [0, 100, 200, 250]
+
+
+
+def test_list_all_filters_and_projects_each_page(client):
+    client.Conversation.find_all.side_effect = paged_find_all(6, max_limit=4)
+
+    result = invoke("conversation", "list", "--all", "--limit", 4,
+                    "--filter", "unread:true", "--properties", "conversation_id")
+
+    assert result.exit_code == 0
+    assert ndjson_output(result) == [{"conversation_id": i} for i in (0, 2, 4)]
+
+
+def test_list_filters_and_projects(client):
+    client.Conversation.find_all.return_value = [
+        {"conversation_id": 1, "subject": "Budget", "unread": True},
+        {"conversation_id": 2, "subject": "Budget", "unread": False},
+        {"conversation_id": 3, "subject": "Other", "unread": True},
+    ]
+
+    result = invoke("conversation", "list", "--filter", "subject=budget,unread:true",
+                    "--properties", "subject,conversation_id")
+
+    assert result.exit_code == 0
+    assert json_output(result) == [{"subject": "Budget", "conversation_id": 1}]
+
+
+def test_reply_reads_text_from_stdin(client):
+    client.Conversation.reply.return_value = {"message_id": 1}
+
+    result = invoke("conversation", "reply", 5, input=b"  Caf\xc3\xa9 \xff\n")
+
+    assert result.exit_code == 0
+    client.Conversation.reply.assert_called_once_with(5, attributes={"text": "Caf\u00e9 \ufffd"})
+
+
+def test_reply_rejects_empty_stdin(client):
+    result = invoke("conversation", "reply", 5, input=b" \n")
+
+    assert result.exit_code == 1
+    assert not client.Conversation.reply.called
+
+
+def test_mark_read_batch_reports_failures_in_order(client):
+    def mark_as_read(conversation_id):
+        if conversation_id == 2:
+            raise Exception("forbidden")
+    client.Conversation.mark_as_read.side_effect = mark_as_read
+
+    result = invoke("conversation", "mark-read-batch", "--ids", "3,2,1", "--concurrency", 2)
+
+    assert result.exit_code != 0
+    # Workers use their own clone of the client
+    assert client.clone.called
+    assert json_output(result) == [
+        {"conversation_id": 3, "marked_read": True},
+        {"conversation_id": 2, "updated": False},
+        {"conversation_id": 1, "marked_read": True},
+    ]
+
+
+def test_mark_read_batch_rejects_invalid_ids(client):
+    result = invoke("conversation", "mark-read-batch", "--ids", "3,x")
+
+    assert result.exit_code == 1
+    assert not client.Conversation.mark_as_read.called
+
+
+def test_unstar_batch_failure_row_is_not_a_state(client):
+    def unstar(conversation_id):
+        if conversation_id == 2:
+            raise Exception("forbidden")
+    client.Conversation.unstar.side_effect = unstar
+
+    result = invoke("conversation", "unstar-batch", "--ids", "1,2")
+
+    assert result.exit_code != 0
+    assert json_output(result) == [
+        {"conversation_id": 1, "starred": False},
+        {"conversation_id": 2, "updated": False},
+    ]
+
+
+def test_search_ndjson_writes_one_line_per_row(client):
+    rows = [{"conversation_id": 1}, {"conversation_id": 2}]
+    # Responses may come back as a (response, data) pair
+    client.Conversation.search.return_value = (object(), rows)
+
+    result = invoke("conversation", "search", "budget", "--ndjson")
+
+    assert result.exit_code == 0
+    assert ndjson_output(result) == rows
+
+
+def test_events_ndjson_writes_one_line_per_row(client):
+    rows = [{"event_id": 1}, {"event_id": 2}]
+    client.Conversation.get_events.return_value = rows
+
+    result = invoke("conversation", "events", 5, "--ndjson")
+
+    assert result.exit_code == 0
+    assert ndjson_output(result) == rows
+
+
+def test_ndjson_and_table_conflict(client):
+    result = invoke("conversation", "events", 5, "--ndjson", "--table")
+
+    assert result.exit_code == 1
+    assert not client.Conversation.get_events.called
@@ -0,0 +1,120 @@
+"""
+Tests for podio_cli.commands.file, run through the CLI with a mocked
+client.
+"""
+import stat
+
+from podio_cli.commands import file as file_commands
+from tests.utils import invoke, json_output
+
+
+def write_content(content):
+    """
+    Returns a stand-in for Files.download_raw writing `content`.
+    """
+    def download_raw(file_id, fileobj):
+        fileobj.write(content)
+        return len(content)
+    return download_raw
+
+
+def file_mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+def test_download_new_file_uses_umask(client, tmp_path, monkeypatch):
+    monkeypatch.setattr(file_commands, "_UMASK", 0o022)
+    target = tmp_path / "report.pdf"
+    client.Files.download_raw.side_effect = write_content(b"new content")
+
+    result = invoke("file", "download", 1, "--output", target)
+
+    assert result.exit_code == 0
+    assert target.read_bytes() == b"new content"
+    assert file_mode(target) == 0o644
+
+
+def test_download_replaces_existing_file_keeping_its_mode(client, tmp_path):
+    target = tmp_path / "report.pdf"
+    target.write_bytes(b"old")
+    target.chmod(0o640)
+    client.Files.download_raw.side_effect = write_content(b"new content")
+
+    result = invoke("file", "download", 1, "--output", target)
+
+    assert result.exit_code == 0
+    assert target.read_bytes() == b"new content"
+    assert file_mode(target) == 0o640
+    assert [p.name for p in tmp_path.iterdir()] == ["report.pdf"]
+
+
+def test_download_failure_keeps_existing_file(client, tmp_path):
+    target = tmp_path / "report.pdf"
+    target.write_bytes(b"old")
+
+    def download_raw(file_id, fileobj):
+        fileobj.write(b"partial")
+        raise Exception("connection reset")
+    client.Files.download_raw.side_effect = download_raw
+
+    result = invoke("file", "download", 1, "--output", target)
+
+    assert result.exit_code != 0
+    assert target.read_bytes() == b"old"
+    # The temporary file is removed as well
+    assert [p.name for p in tmp_path.iterdir()] == ["report.pdf"]
+
+
+def test_download_batch_reports_failures_in_order(client, tmp_path):
+    def find(file_id):
+        if file_id == 2:
+            raise Exception("not found")
+        return {"name": "file%s.txt" % file_id}
+    client.Files.find.side_effect = find
+
+    def download_raw(file_id, fileobj):
+        if file_id == 3:
+            raise Exception("connection reset")
+        return write_content(b"data")(file_id, fileobj)
+    client.Files.download_raw.side_effect = download_raw
+
+    result = invoke("file", "download-batch", "--ids", "3,2,1", "--out-dir", tmp_path)
+
+    assert result.exit_code != 0
+    assert json_output(result) == [
+        {"file_id": 3, "downloaded": False},
+        {"file_id": 2, "downloaded": False},
+        {"file_id": 1, "downloaded": True, "filename": str(tmp_path / "file1.txt"), "size": 4},
+    ]
+    assert [p.name for p in tmp_path.iterdir()] == ["file1.txt"]
+
+
+def test_download_batch_prefixes_duplicate_names(client, tmp_path):
+    client.Files.find.return_value = {"name": "report.pdf"}
+    client.Files.download_raw.side_effect = write_content(b"data")
+
+    result = invoke("file", "download-batch", "--ids", "1,2", "--out-dir", tmp_path)
+
+    assert result.exit_code == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["2_report.pdf", "report.pdf"]
+
+
+def test_download_batch_keeps_files_in_out_dir(client, tmp_path):
+    out_dir = tmp_path / "out"
+    out_dir.mkdir()
+    names = {1: "../../escape.txt", 2: "/etc/passwd", 3: "..", 4: "passwd", 5: ""}
+    client.Files.find.side_effect = lambda file_id: {"name": names[file_id]}
+    client.Files.download_raw.side_effect = write_content(b"data")
+
+    result = invoke("file", "download-batch", "--ids", "1,2,3,4,5", "--out-dir", out_dir)
+
+    assert result.exit_code == 0
+    assert sorted(p.name for p in out_dir.iterdir()) == ["3", "4_passwd", "5", "escape.txt", "passwd"]
+    assert [p.name for p in tmp_path.iterdir()] == ["out"]
+
+
+def test_download_batch_rejects_invalid_ids(client, tmp_path):
+    result = invoke("file", "download-batch", "--ids", "1,,2", "--out-dir", tmp_path)
+
+    assert result.exit_code == 1
+    assert not client.Files.find.called
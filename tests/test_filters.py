@@ -0,0 +1,102 @@
+"""
+Tests for podio_cli.filters.
+"""
+from podio_cli.filters import (
+    _parse_filter,
+    apply_client_filter,
+    apply_field_filters,
+    apply_list_pipeline,
+    apply_properties_filter,
+)
+
+
+def test_parse_filter_puts_flag_checks_first():
+    assert _parse_filter("subject:Budget, unread:TRUE,starred=false") == (
+        ("unread", "true"), ("starred", "false"), ("subject", "budget"))
+
+
+def test_list_pipeline_filters_limits_and_projects():
+    rows = [{"id": i, "even": i % 2 == 0, "x": 0} for i in range(10)]
+
+    assert apply_list_pipeline(rows, "even:true", "id", 3) == [{"id": 0}, {"id": 2}, {"id": 4}]
+
+
+def test_list_pipeline_without_limit():
+    rows = [{"id": i, "even": i % 2 == 0, "x": 0} for i in range(10)]
+
+    assert apply_list_pipeline(rows, "even:true", "id") == [{"id": i} for i in range(0, 10, 2)]
+    assert apply_list_pipeline(rows, None, None) is rows
+    assert apply_list_pipeline(rows, None, "x,id")[0] == {"x": 0, "id": 0}
+
+
+def test_list_pipeline_projects_single_dict():
+    assert apply_list_pipeline({"id": 1, "x": 0}, "id:2", "id", 0) == {"id": 1}
+
+
+def test_properties_filter_orders_keys_as_requested():
+    rows = [{"b": 1, "a": 2}, {"a": 3, "b": 4, "c": 5}]
+
+    result = apply_properties_filter(rows, "a,b")
+
+    assert [list(row) for row in result] == [["a", "b"], ["a", "b"]]
+
+
+def test_properties_filter_key_order_does_not_depend_on_data():
+    # No row has a field to drop, but the keys still need reordering
+    rows = [{"b": 1, "a": 2}]
+
+    assert list(apply_properties_filter(rows, "a,b")[0]) == ["a", "b"]
+
+
+def test_properties_filter_returns_rows_already_in_shape():
+    rows = [{"a": 1, "b": 2}, {"b": 3}]
+
+    assert apply_properties_filter(rows, "a,b") is rows
+
+
+def test_properties_filter_wrapped_items_and_single_dict():
+    data = {"total": 1, "items": [{"item_id": 1, "title": "x"}]}
+
+    assert apply_properties_filter(data, "item_id") == {"total": 1, "items": [{"item_id": 1}]}
+    assert apply_properties_filter({"b": 1, "a": 2, "c": 3}, "a, b") == {"a": 2, "b": 1}
+
+
+def test_client_filter_matches_case_insensitively():
+    rows = [{"status": "Active", "url": "http://a"}, {"status": "inactive"}]
+
+    assert apply_client_filter(rows, "status:active") == [rows[0]]
+    assert apply_client_filter(rows, "status=ACTIVE, url:http://a") == [rows[0]]
+
+
+def test_client_filter_splits_at_first_separator():
+    rows = [{"a": "b:c"}, {"a": "b"}]
+
+    assert apply_client_filter(rows, "a=b:c") == [rows[0]]
+
+
+def test_client_filter_leaves_non_lists_alone():
+    data = {"status": "inactive"}
+
+    assert apply_client_filter(data, "status:active") is data
+    assert apply_client_filter([data], None) == [data]
+
+
+def test_field_filters_operators():
+    rows = [{"name": "Contacts", "n": "5"}, {"name": "Leads", "n": "7"}, {"n": "9"}]
+
+    assert apply_field_filters(rows, ["name:Contacts"]) == [rows[0]]
+    assert apply_field_filters(rows, ["name:contains:cont"]) == [rows[0]]
+    assert apply_field_filters(rows, ["name:ne:contacts"]) == [rows[1]]
+    assert apply_field_filters(rows, ["n:gt:6"]) == rows[1:]
+    assert apply_field_filters(rows, ["n:lt:6"]) == [rows[0]]
+
+
+def test_field_filters_combine_and_skip_malformed():
+    rows = [{"name": "Contacts", "n": "5"}, {"name": "Leads", "n": "7"}, {"n": "9"}]
+
+    assert apply_field_filters(rows, ["n:gt:6", "name:leads", "nonsense"]) == [rows[1]]
+    assert apply_field_filters(rows, ["nonsense"]) == rows
+
+
+def test_field_filters_unknown_operator_matches_nothing():
+    assert apply_field_filters([{"name": "x"}], ["name:bogus:x"]) == []
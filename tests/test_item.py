@@ -0,0 +1,109 @@
+"""
+Tests for podio_cli.commands.item, run through the CLI with a mocked
+client.
+"""
+from tests.utils import invoke, json_output, ndjson_output
+
+
+def paged_filter(total, max_limit=500, report_filtered=True):
+    """
+    Returns a stand-in for Item.filter serving `total` items, at most
+    `max_limit` per request like the Podio API.
+    """
+    def item_filter(app_id, attributes):
+        offset = attributes["offset"]
+        end = min(offset + min(attributes["limit"], max_limit), total)
+        result = {"items": [{"item_id": i, "title": "Item %s" % i} for i in range(offset, end)]}
+        if report_filtered:
+            result["filtered"] = total
+        return result
+    return item_filter
+
+
+def test_get_batch_reports_failures_in_order(client):
+    def find(item_id, basic=False):
+        if item_id == 2:
+            raise Exception("not found")
+        return {"item_id": item_id, "title": "Item %s" % item_id}
+    client.Item.find.side_effect = find
+
+    result = invoke("item", "get-batch", "--ids", "3,2,1", "--concurrency", 2)
+
+    assert result.exit_code != 0
+    assert json_output(result) == [
+        {"item_id": 3, "title": "Item 3"},
+        {"item_id": 2, "retrieved": False},
+        {"item_id": 1, "title": "Item 1"},
+    ]
+    # Workers use their own clone of the client
+    assert client.clone.called
+
+
+def test_get_batch_passes_basic(client):
+    client.Item.find.return_value = {"item_id": 1}
+
+    result = invoke("item", "get-batch", "--ids", "1", "--basic")
+
+    assert result.exit_code == 0
+    client.Item.find.assert_called_once_with(item_id=1, basic=True)
+
+
+def test_get_batch_rejects_invalid_ids(client):
+    result = invoke("item", "get-batch", "--ids", "1;2")
+
+    assert result.exit_code == 1
+    assert not client.Item.find.called
+
+
+def test_list_all_pages_past_api_cap(client):
+    client.Item.filter.side_effect = paged_filter(1200)
+
+    result = invoke("item", "list", 1, "--all", "--limit", 1000)
+
+    assert result.exit_code == 0
+    assert [row["item_id"] for row in ndjson_output(result)] == list(range(1200))
+    # Page size is capped at 500 and the filtered count ends paging
+    assert client.Item.filter.call_count == 3
+    assert client.Item.filter.call_args.kwargs["attributes"]["limit"] == 500
+
+
+def test_list_all_stops_on_empty_page_without_count(client):
+    client.Item.filter.side_effect = paged_filter(7, report_filtered=False)
+
+    result = invoke("item", "list", 1, "--all", "--limit", 3, "--properties", "item_id")
+
+    assert result.exit_code == 0
+    assert ndjson_output(result) == [{"item_id": i} for i in range(7)]
+    # The short page (item 6) is not taken as the end; an empty one is
+    assert client.Item.filter.call_count == 4
+
+
+def test_create_accepts_escaped_fields_key(client, tmp_path):
+    payload = tmp_path / "item.json"
+    payload.write_bytes(b'{"\\u0066ields": {"title": "x"}}')
+    client.Item.create.return_value = {"item_id": 1}
+
+    result = invoke("item", "create", 5, "--json-file", payload)
+
+    assert result.exit_code == 0
+    assert client.Item.create.call_args.kwargs["attributes"] == payload.read_bytes()
+
+
+def test_create_rejects_payload_without_fields(client, tmp_path):
+    payload = tmp_path / "item.json"
+    payload.write_bytes(b'{"title": "x"}')
+
+    result = invoke("item", "create", 5, "--json-file", payload)
+
+    assert result.exit_code == 1
+    assert not client.Item.create.called
+
+
+def test_create_rejects_escaped_payload_without_fields(client, tmp_path):
+    payload = tmp_path / "item.json"
+    payload.write_bytes(b'{"title": "\\u0078"}')
+
+    result = invoke("item", "create", 5, "--json-file", payload)
+
+    assert result.exit_code == 1
+    assert not client.Item.create.called
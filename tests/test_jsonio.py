@@ -0,0 +1,79 @@
+"""
+Tests for podio_cli.jsonio. Each parsing test runs with orjson (when it
+is installed) and with the standard library fallback.
+"""
+import mmap
+from unittest import mock
+
+import pytest
+
+from podio_cli import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def parser(request, monkeypatch):
+    if request.param == "orjson":
+        if jsonio.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+def test_loads_bytes_and_str(parser):
+    assert jsonio.loads(b'{"name": "caf\xc3\xa9", "ids": [1, 2]}') == {"name": "café", "ids": [1, 2]}
+    assert jsonio.loads('{"name": "café"}') == {"name": "café"}
+
+
+def test_loads_invalid_json(parser):
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads(b'{"name": ')
+
+
+
+def test_loads_malformed_utf8(parser):
+    # Both parsers report bad UTF-8 as a JSON error rather than UnicodeDecodeError
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.loads(b'{"name": "\xff"}')
+
+
+def test_load_file_small(parser, tmp_path):
+    path = tmp_path / "small.json"
+    path.write_bytes(b'{"fields": {"title": "x"}}')
+
+    assert jsonio.load_file(path) == {"fields": {"title": "x"}}
+
+
+def test_load_file_large_is_memory_mapped(monkeypatch, tmp_path):
+    if jsonio.orjson is None:
+        pytest.skip("orjson is not installed")
+    path = tmp_path / "large.json"
+    path.write_bytes(b'{"values": [' + b", ".join([b"1"] * 1000) + b"]}")
+    monkeypatch.setattr(jsonio, "MMAP_THRESHOLD", 1024)
+    with mock.patch.object(jsonio.mmap, "mmap", wraps=mmap.mmap) as mapped:
+        data = jsonio.load_file(path)
+
+    assert mapped.called
+    assert data == {"values": [1] * 1000}
+
+
+def test_load_file_large_without_orjson(parser, monkeypatch, tmp_path):
+    path = tmp_path / "large.json"
+    path.write_bytes(b'{"values": [' + b", ".join([b"1"] * 1000) + b"]}")
+    monkeypatch.setattr(jsonio, "MMAP_THRESHOLD", 1024)
+
+    assert jsonio.load_file(path) == {"values": [1] * 1000}
+
+
+def test_load_file_invalid_json(parser, monkeypatch, tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_bytes(b'{"values": [' + b" " * 2048)
+    monkeypatch.setattr(jsonio, "MMAP_THRESHOLD", 1024)
+
+    with pytest.raises(jsonio.JSONDecodeError):
+        jsonio.load_file(path)
+
+
+def test_load_file_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        jsonio.load_file(tmp_path / "missing.json")
@@ -0,0 +1,65 @@
+"""
+Tests for podio_cli.output.
+"""
+import io
+import os
+import sys
+
+from podio_cli import output
+
+
+def test_write_stdout_to_text_only_stream(monkeypatch):
+    stream = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    output._write_stdout('{"name": "café"}\n'.encode("utf-8"))
+
+    assert stream.getvalue() == '{"name": "café"}\n'
+
+
+def test_write_stdout_without_file_descriptor(monkeypatch):
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stream)
+
+    stream.write("before ")
+    output._write_stdout(b"after")
+    stream.flush()
+
+    assert raw.getvalue() == b"before after"
+
+
+def test_write_stdout_to_pipe_writes_every_byte(monkeypatch):
+    read_fd, write_fd = os.pipe()
+    stream = io.TextIOWrapper(io.FileIO(write_fd, "w"), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdout", stream)
+    # Force short writes so the loop has to resume part-way through
+    real_write = os.write
+    writes = []
+
+    def short_write(fd, data):
+        writes.append(fd)
+        return real_write(fd, data[:3])
+    monkeypatch.setattr(os, "write", short_write)
+
+    stream.write("[")
+    output._write_stdout(b'{"id": 1}]')
+    stream.close()
+
+    with io.FileIO(read_fd, "r") as pipe:
+        assert pipe.read() == b'[{"id": 1}]'
+    assert writes and set(writes) == {write_fd}
+
+
+def test_write_stdout_to_terminal_uses_buffer(monkeypatch):
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    monkeypatch.setattr(stream, "fileno", lambda: 1)
+    monkeypatch.setattr(stream, "isatty", lambda: True)
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setattr(os, "write", None)
+
+    output._write_stdout(b"tty")
+    stream.flush()
+
+    assert raw.getvalue() == b"tty"
@@ -0,0 +1,58 @@
+"""
+Tests for podio_cli.commands.task.
+"""
+from podio_cli.commands.task import _push_down_filters
+from tests.utils import invoke, json_output
+
+
+def test_label_update_parses_ids_and_names(client):
+    client.Task.update_labels.return_value = {}
+
+    result = invoke("task", "label", "update", 5, "--labels", "123, High Priority,45x, 7")
+
+    assert result.exit_code == 0
+    client.Task.update_labels.assert_called_once_with(task_id=5, labels=[123, "High Priority", "45x", 7])
+
+
+def test_push_down_status_filter():
+    params = {"limit": 10}
+
+    remaining = _push_down_filters(["status:Completed", "text:contains:invoice"], params)
+
+    assert params == {"limit": 10, "completed": True}
+    assert remaining == ["text:contains:invoice"]
+
+
+def test_push_down_status_eq_filter():
+    params = {}
+
+    assert _push_down_filters(["status:eq:active"], params) == []
+    assert params == {"completed": False}
+
+
+def test_push_down_keeps_explicit_completed():
+    params = {"completed": False}
+
+    assert _push_down_filters(["status:completed"], params) == ["status:completed"]
+    assert params == {"completed": False}
+
+
+def test_push_down_leaves_other_status_filters():
+    params = {}
+    filters = ["status:ne:active", "status:unknown", "status:contains:act"]
+
+    assert _push_down_filters(filters, params) == filters
+    assert params == {}
+
+
+def test_list_sends_status_filter_to_podio(client):
+    client.transport.GET.return_value = [
+        {"task_id": 1, "status": "completed", "text": "Send invoice"},
+        {"task_id": 2, "status": "completed", "text": "Call"},
+    ]
+
+    result = invoke("task", "list", "--filter", "status:completed", "--filter", "text:contains:invoice")
+
+    assert result.exit_code == 0
+    client.transport.GET.assert_called_once_with(url="/task/", limit=100, completed=True)
+    assert [task["task_id"] for task in json_output(result)] == [1]
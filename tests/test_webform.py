@@ -0,0 +1,37 @@
+"""
+Tests for podio_cli.commands.webform.
+"""
+from podio_cli.commands.webform import _CSRF_HEAD_SIZE, _extract_csrf_token
+
+META = '<meta name="csrf-token" content="meta-token">'
+BOOTSTRAP = '<script>window.data = {"csrfToken": "bootstrap-token"};</script>'
+
+
+def test_csrf_token_from_meta_tag():
+    assert _extract_csrf_token("<html><head>%s</head></html>" % META) == "meta-token"
+
+
+def test_csrf_token_from_bootstrap_data():
+    assert _extract_csrf_token("<html><body>%s</body></html>" % BOOTSTRAP) == "bootstrap-token"
+
+
+def test_csrf_meta_tag_wins_over_bootstrap_data():
+    assert _extract_csrf_token(BOOTSTRAP + META) == "meta-token"
+
+
+def test_csrf_token_after_the_head():
+    html = "<html>" + " " * _CSRF_HEAD_SIZE + BOOTSTRAP + "</html>"
+
+    assert _extract_csrf_token(html) == "bootstrap-token"
+
+
+def test_csrf_token_across_the_head_boundary():
+    # The head scan sees a truncated tag; the full scan must still find it
+    html = " " * (_CSRF_HEAD_SIZE - 20) + META
+
+    assert _extract_csrf_token(html) == "meta-token"
+
+
+def test_csrf_token_missing():
+    assert _extract_csrf_token("<html>" + " " * _CSRF_HEAD_SIZE + "</html>") is None
+    assert _extract_csrf_token("") is None
@@ -0,0 +1,31 @@
+"""
+Helper methods for testing
+"""
+import json
+
+from typer.testing import CliRunner
+
+from podio_cli.main import app
+
+
+def invoke(*args, input=None):
+    """
+    Runs the podio CLI in-process with the given arguments, feeding
+    `input` (bytes or str) on stdin. Returned as the click Result
+    (exit_code, stdout and stderr are kept separate).
+    """
+    return CliRunner().invoke(app, [str(arg) for arg in args], input=input)
+
+
+def json_output(result):
+    """
+    Parses the JSON a command wrote to stdout.
+    """
+    return json.loads(result.stdout)
+
+
+def ndjson_output(result):
+    """
+    Parses the NDJSON a command wrote to stdout, one record per line.
+    """
+    return [json.loads(line) for line in result.stdout.splitlines()]